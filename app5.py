@@ -1,10 +1,16 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
+import hashlib
 import json
 
+import charts
+import contributions
+import filters
+import templates
+from geo import GeoIndex
+from stats import DatasetStats
+
 # Cấu hình trang
 st.set_page_config(
     page_title="Hôm Nay Ăn Gì?",
@@ -13,49 +19,12 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# CSS tùy chỉnh
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        text-align: center;
-        color: #FF6B6B;
-        margin-bottom: 0.5rem;
-    }
-    .sub-header {
-        font-size: 1.5rem;
-        text-align: center;
-        color: #4ECDC4;
-        margin-bottom: 2rem;
-    }
-    .feature-card {
-        background-color: #f0f2f6;
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .restaurant-card {
-        background-color: white;
-        padding: 1rem;
-        border-radius: 8px;
-        border: 1px solid #ddd;
-        margin: 0.5rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-    }
-    .stat-box {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 10px;
-        text-align: center;
-        margin: 1rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+# CSS tùy chỉnh (static/app5.css, được cache ở trình duyệt)
+st.markdown(templates.stylesheet("app5.css"), unsafe_allow_html=True)
 
-# Dữ liệu mẫu về quán ăn
+# Dữ liệu mẫu về quán ăn, viết sẵn trong code: app5 không đọc kho dữ liệu nên
+# không có cập nhật trực tiếp. Dữ liệu (và phiên bản) chỉ đổi khi sửa code;
+# đóng góp gửi từ app5 chỉ xuất hiện ở app chính sau khi được kiểm duyệt
 @st.cache_data
 def load_restaurant_data():
     restaurants = [
@@ -235,10 +204,45 @@ def load_restaurant_data():
             "lng": 105.8090
         }
     ]
-    return pd.DataFrame(restaurants)
+    # Phiên bản dữ liệu: dấu vân tay nội dung, tính cùng lúc với bảng nên luôn đổi
+    # theo dữ liệu. Các cache dựng từ dữ liệu (chỉ mục, thống kê...) lấy làm khóa
+    # để không dùng lại bản cũ
+    payload = json.dumps(restaurants, ensure_ascii=False, sort_keys=True)
+    version = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+    # Cột list (loại món, bữa ăn) được mã hóa sẵn thành cột bool để lọc bằng mask
+    return filters.encode_list_columns(pd.DataFrame(restaurants)), version
+
+# Các cache dựng từ dữ liệu giữ tối đa hai phiên bản: phiên bản hiện tại và bản
+# trước đó cho session còn đang chạy lúc code đổi; bản cũ hơn bị bỏ khỏi bộ nhớ
+
+# Chỉ mục tọa độ để tìm quán lân cận
+@st.cache_resource(max_entries=2)
+def load_geo_index(version):
+    df, _ = load_restaurant_data()
+    return GeoIndex(df['lat'], df['lng'])
+
+# Số liệu cho trang chủ và trang Thống kê, tính một lần cho mỗi phiên bản dữ liệu
+@st.cache_resource(max_entries=2)
+def load_stats(version):
+    df, _ = load_restaurant_data()
+    return DatasetStats(df)
+
+# Biểu đồ trang Thống kê: mỗi (phiên bản dữ liệu, biểu đồ) chỉ dựng figure một
+# lần và dùng chung giữa các session. Lần xem sau không dựng hay kiểm tra lại
+# figure, chỉ còn bước Streamlit chuyển figure thành JSON gửi xuống trình duyệt
+# (đưa dict/JSON thay vì figure thì st.plotly_chart lại kiểm tra toàn bộ)
+@st.cache_resource(show_spinner=False, max_entries=2 * len(charts.CHARTS))
+def stats_figure(version, chart):
+    return charts.stats_figure(load_stats(version), chart)
+
+# Một thread ghi đóng góp cho cả process, dùng chung giữa các session
+@st.cache_resource(max_entries=1)
+def get_contribution_writer():
+    return contributions.ContributionWriter()
 
 # Load data
-df_restaurants = load_restaurant_data()
+df_restaurants, version = load_restaurant_data()
+geo_index = load_geo_index(version)
 
 # Sidebar navigation
 st.sidebar.title("📍 Menu")
@@ -335,13 +339,14 @@ if page == "🏠 Trang chủ":
     st.markdown("---")
     
     # Statistics preview
+    stats = load_stats(version)
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("🏪 Tổng số quán", len(df_restaurants))
+        st.metric("🏪 Tổng số quán", stats.count)
     with col2:
-        st.metric("💵 Giá TB", f"{int(df_restaurants['avg_price'].mean())}k")
+        st.metric("💵 Giá TB", f"{int(stats.mean_price)}k")
     with col3:
-        st.metric("⭐ Đánh giá TB", f"{df_restaurants['rating'].mean():.1f}/5")
+        st.metric("⭐ Đánh giá TB", f"{stats.mean_rating:.1f}/5")
 
 # ===========================================
 # TRANG 2: TÌM QUÁN ĂN
@@ -367,12 +372,9 @@ elif page == "🔍 Tìm quán ăn":
         )
     
     with col3:
-        all_food_types = set()
-        for types in df_restaurants['food_type']:
-            all_food_types.update(types)
         food_type_filter = st.selectbox(
             "🍜 Loại món",
-            ["Tất cả"] + sorted(list(all_food_types))
+            ["Tất cả"] + filters.list_values(df_restaurants, 'food_type')
         )
     
     with col4:
@@ -381,30 +383,10 @@ elif page == "🔍 Tìm quán ăn":
             ["Tất cả", "Sáng", "Trưa", "Tối", "Khuya"]
         )
     
-    # Áp dụng bộ lọc
-    filtered_df = df_restaurants.copy()
-    
-    if distance_filter != "Tất cả":
-        if distance_filter == "<500m":
-            filtered_df = filtered_df[filtered_df['distance'] < 0.5]
-        elif distance_filter == "500m-1km":
-            filtered_df = filtered_df[(filtered_df['distance'] >= 0.5) & (filtered_df['distance'] < 1)]
-        else:  # 1-2km
-            filtered_df = filtered_df[(filtered_df['distance'] >= 1) & (filtered_df['distance'] <= 2)]
-    
-    if price_filter != "Tất cả":
-        if price_filter == "<30k":
-            filtered_df = filtered_df[filtered_df['avg_price'] < 30]
-        elif price_filter == "30-50k":
-            filtered_df = filtered_df[(filtered_df['avg_price'] >= 30) & (filtered_df['avg_price'] <= 50)]
-        else:  # >50k
-            filtered_df = filtered_df[filtered_df['avg_price'] > 50]
-    
-    if food_type_filter != "Tất cả":
-        filtered_df = filtered_df[filtered_df['food_type'].apply(lambda x: food_type_filter in x)]
-    
-    if meal_filter != "Tất cả":
-        filtered_df = filtered_df[filtered_df['meals'].apply(lambda x: meal_filter in x)]
+    # Áp dụng bộ lọc: mỗi bộ lọc là một mask bool trên cả bảng
+    filtered_df = df_restaurants[filters.filter_mask(
+        df_restaurants, distance_filter, price_filter, food_type_filter, meal_filter
+    )]
     
     st.markdown("---")
     
@@ -502,12 +484,22 @@ elif page == "🏪 Chi tiết quán":
         st.markdown(f"**⭐ Đánh giá trung bình: {restaurant['rating']}/5**")
         for review in restaurant['reviews']:
             st.info(f"💭 {review}")
+    
+    # Quán lân cận tính từ tọa độ của quán đang xem
+    st.markdown("### 🧭 Quán lân cận")
+    positions, distances = geo_index.nearest(
+        restaurant['lat'], restaurant['lng'], k=3, exclude=selected_idx
+    )
+    for pos, distance in zip(positions, distances):
+        nearby = df_restaurants.iloc[pos]
+        st.markdown(f"- **{nearby['name']}** ({nearby['address']}): {distance:.0f}m")
 
 # ===========================================
 # TRANG 4: THỐNG KÊ
 # ===========================================
 elif page == "📊 Thống kê":
     st.title("📊 Tổng quan dữ liệu")
+    stats = load_stats(version)
     
     # Thống kê tổng quan
     col1, col2, col3, col4 = st.columns(4)
@@ -515,7 +507,7 @@ elif page == "📊 Thống kê":
     with col1:
         st.markdown(f"""
         <div class="stat-box">
-            <h1>{len(df_restaurants)}</h1>
+            <h1>{stats.count}</h1>
             <p>Tổng số quán</p>
         </div>
         """, unsafe_allow_html=True)
@@ -523,7 +515,7 @@ elif page == "📊 Thống kê":
     with col2:
         st.markdown(f"""
         <div class="stat-box">
-            <h1>{int(df_restaurants['avg_price'].mean())}k</h1>
+            <h1>{int(stats.mean_price)}k</h1>
             <p>Giá trung bình</p>
         </div>
         """, unsafe_allow_html=True)
@@ -531,7 +523,7 @@ elif page == "📊 Thống kê":
     with col3:
         st.markdown(f"""
         <div class="stat-box">
-            <h1>{df_restaurants['rating'].mean():.1f}</h1>
+            <h1>{stats.mean_rating:.1f}</h1>
             <p>Đánh giá TB</p>
         </div>
         """, unsafe_allow_html=True)
@@ -539,7 +531,7 @@ elif page == "📊 Thống kê":
     with col4:
         st.markdown(f"""
         <div class="stat-box">
-            <h1>{df_restaurants['distance'].mean():.1f}km</h1>
+            <h1>{stats.mean_distance:.1f}km</h1>
             <p>Khoảng cách TB</p>
         </div>
         """, unsafe_allow_html=True)
@@ -551,62 +543,21 @@ elif page == "📊 Thống kê":
     
     with col1:
         st.markdown("### 🍜 Phân bố loại món")
-        food_types = []
-        for types in df_restaurants['food_type']:
-            food_types.extend(types)
-        food_type_counts = pd.Series(food_types).value_counts()
-        
-        fig = px.pie(
-            values=food_type_counts.values,
-            names=food_type_counts.index,
-            title="Các loại món phổ biến",
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(stats_figure(version, "types"), use_container_width=True)
     
     with col2:
         st.markdown("### 💰 Phân bố giá")
-        fig = px.histogram(
-            df_restaurants,
-            x='avg_price',
-            nbins=10,
-            title="Phân bố mức giá trung bình",
-            labels={'avg_price': 'Giá (nghìn đồng)'},
-            color_discrete_sequence=['#FF6B6B']
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(stats_figure(version, "prices"), use_container_width=True)
     
     # Biểu đồ thời gian
     st.markdown("### ⏰ Khung giờ phù hợp")
-    meals_count = {"Sáng": 0, "Trưa": 0, "Tối": 0, "Khuya": 0}
-    for meals in df_restaurants['meals']:
-        for meal in meals:
-            meals_count[meal] = meals_count.get(meal, 0) + 1
-    
-    fig = px.bar(
-        x=list(meals_count.keys()),
-        y=list(meals_count.values()),
-        title="Số quán phù hợp theo khung giờ",
-        labels={'x': 'Bữa ăn', 'y': 'Số quán'},
-        color=list(meals_count.values()),
-        color_continuous_scale='Viridis'
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(stats_figure(version, "meals"), use_container_width=True)
     
     # Biểu đồ khoảng cách vs giá
     st.markdown("### 📊 Mối quan hệ giữa khoảng cách và giá")
-    fig = px.scatter(
-        df_restaurants,
-        x='distance',
-        y='avg_price',
-        size='rating',
-        color='rating',
-        hover_data=['name'],
-        title="Khoảng cách vs Giá (Size: Đánh giá)",
-        labels={'distance': 'Khoảng cách (km)', 'avg_price': 'Giá TB (nghìn đồng)'},
-        color_continuous_scale='RdYlGn'
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    if stats.scatter_mode == "binned":
+        st.caption(f"{stats.count} quán được gộp thành lưới theo khoảng cách và giá; màu ô là số quán")
+    st.plotly_chart(stats_figure(version, "scatter"), use_container_width=True)
 
 # ===========================================
 # TRANG 5: VỀ DỰ ÁN
@@ -825,25 +776,38 @@ elif page == "📩 Đóng góp":
         
         if submitted:
             if restaurant_name and address and price and food_types and review:
-                st.success(f"""
-                ✅ **Cảm ơn bạn đã đóng góp!**
+                future = get_contribution_writer().submit("app5", restaurant_name, address, {
+                    "price_range": price,
+                    "food_type": food_types,
+                    "rating": rating,
+                    "distance": distance,
+                    "meals": meals,
+                    "review": review,
+                })
+                try:
+                    future.result(timeout=contributions.SUBMIT_TIMEOUT)
+                except Exception:
+                    st.error("⚠️ Chưa lưu được đóng góp của bạn, vui lòng thử lại sau.")
+                else:
+                    st.success(f"""
+                    ✅ **Cảm ơn bạn đã đóng góp!**
                 
-                Thông tin về **{restaurant_name}** đã được ghi nhận. 
-                Chúng tôi sẽ xem xét và cập nhật vào hệ thống sớm nhất!
-                """)
+                    Thông tin về **{restaurant_name}** đã được ghi nhận. 
+                    Chúng tôi sẽ xem xét và cập nhật vào hệ thống sớm nhất!
+                    """)
                 
-                st.balloons()
+                    st.balloons()
                 
-                # Hiển thị thông tin đã gửi
-                with st.expander("Xem thông tin bạn vừa gửi"):
-                    st.write(f"**Tên quán:** {restaurant_name}")
-                    st.write(f"**Địa chỉ:** {address}")
-                    st.write(f"**Giá:** {price}")
-                    st.write(f"**Loại món:** {', '.join(food_types)}")
-                    st.write(f"**Đánh giá:** {rating}/5")
-                    st.write(f"**Khoảng cách:** {distance}km")
-                    st.write(f"**Bữa ăn:** {', '.join(meals) if meals else 'Chưa chọn'}")
-                    st.write(f"**Review:** {review}")
+                    # Hiển thị thông tin đã gửi
+                    with st.expander("Xem thông tin bạn vừa gửi"):
+                        st.write(f"**Tên quán:** {restaurant_name}")
+                        st.write(f"**Địa chỉ:** {address}")
+                        st.write(f"**Giá:** {price}")
+                        st.write(f"**Loại món:** {', '.join(food_types)}")
+                        st.write(f"**Đánh giá:** {rating}/5")
+                        st.write(f"**Khoảng cách:** {distance}km")
+                        st.write(f"**Bữa ăn:** {', '.join(meals) if meals else 'Chưa chọn'}")
+                        st.write(f"**Review:** {review}")
             else:
                 st.error("⚠️ Vui lòng điền đầy đủ các thông tin bắt buộc (*)")
     
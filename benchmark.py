@@ -0,0 +1,245 @@
+"""Đo thời gian các đường xử lý nặng trên dữ liệu sinh ngẫu nhiên.
+
+Dùng từ dòng lệnh:
+
+    python benchmark.py filters [số quán ...]    (mặc định 10000 1000000)
+    python benchmark.py charts [số quán ...]     (mặc định 500 5000 100000 1000000)
+    python benchmark.py suite [số quán ...]      (mặc định 100 10000 100000)
+
+``suite`` sinh danh mục giả lập (``synthetic``) theo cấu trúc của app chính, lưu
+vào một kho SQLite tạm rồi đo lần lượt: nạp dữ liệu, dựng ``Catalogue``, từng
+đường lọc/tìm kiếm của trang "Tìm quán", trang chi tiết và trang thống kê của
+app5. Mỗi bước được in ngay khi xong, để với danh mục rất lớn vẫn thấy được các
+bước đã chạy nếu tiến trình bị dừng giữa chừng.
+
+``suite`` cần khoảng 1,3 GB RAM cho mỗi 100 nghìn quán (đỉnh khi dựng
+``Catalogue``: danh sách quán cùng các chỉ mục đều nằm trong bộ nhớ; 300 nghìn
+quán đỉnh 3,9 GB), nên mặc định chỉ chạy tới 100 nghìn quán; 1 triệu quán cần
+khoảng 13 GB.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import charts
+import data_store
+import filters
+import synthetic
+import templates
+from catalogue import Catalogue
+from recommend import Recommender
+from similar import SimilarIndex
+from stats import DatasetStats
+
+FOOD_TYPES = ["Cơm", "Cơm tấm", "Phở", "Bún", "Bún chả", "Mì", "Mì Quảng", "Trà sữa",
+              "Đồ uống", "Bánh mì", "Lẩu", "Nướng", "Xôi", "Chè", "Đồ ăn vặt"]
+MEALS = ["Sáng", "Trưa", "Tối", "Khuya"]
+# Trên SIMILAR_LIMIT quán không dựng bảng quán tương tự (tốn bộ nhớ và vài phút)
+SIMILAR_LIMIT = 20_000
+
+
+def app5_frame(rows, seed=0):
+    """DataFrame cùng cấu trúc với dữ liệu của app5 (chỉ các cột dùng để lọc)."""
+    rng = np.random.default_rng(seed)
+    type_counts = rng.integers(1, 4, rows)
+    meal_counts = rng.integers(1, len(MEALS) + 1, rows)
+    return pd.DataFrame({
+        "name": [f"Quán {i}" for i in range(rows)],
+        "distance": np.round(rng.uniform(0.05, 2.5, rows), 2),
+        "avg_price": rng.integers(15, 90, rows),
+        "rating": np.round(rng.uniform(3, 5, rows), 1),
+        "food_type": [list(rng.choice(FOOD_TYPES, n, replace=False)) for n in type_counts],
+        "meals": [list(rng.choice(MEALS, n, replace=False)) for n in meal_counts],
+    })
+
+
+def filter_rowwise(df, distance, price, food_type, meal):
+    # Cách lọc cũ của app5: so sánh cột số, lọc cột list bằng apply từng dòng
+    out = df
+    if distance != filters.ALL:
+        low, high, inclusive = filters.DISTANCE_RANGES[distance]
+        out = out[out["distance"].between(low, high, inclusive=inclusive)]
+    if price != filters.ALL:
+        low, high, inclusive = filters.PRICE_RANGES[price]
+        out = out[out["avg_price"].between(low, high, inclusive=inclusive)]
+    # astype(bool): trên bảng rỗng apply trả về Series object, bị hiểu là chọn cột
+    if food_type != filters.ALL:
+        out = out[out["food_type"].apply(lambda x: food_type in x).astype(bool)]
+    if meal != filters.ALL:
+        out = out[out["meals"].apply(lambda x: meal in x).astype(bool)]
+    return out
+
+
+def filter_vectorized(df, distance, price, food_type, meal):
+    return df[filters.filter_mask(df, distance, price, food_type, meal)]
+
+
+def timed(func, *args, repeat=3):
+    # Thời gian nhanh nhất (giây) trong ``repeat`` lần chạy, cùng kết quả lần cuối
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_filters(rows):
+    df = app5_frame(rows)
+    encode_time, encoded = timed(filters.encode_list_columns, df, repeat=1)
+    print(f"{rows} quán: mã hóa multi-hot {encode_time * 1000:.1f} ms (một lần cho mỗi phiên bản dữ liệu)")
+    cases = [
+        ("loại món", (filters.ALL, filters.ALL, "Phở", filters.ALL)),
+        ("bữa ăn", (filters.ALL, filters.ALL, filters.ALL, "Khuya")),
+        ("cả bốn bộ lọc", ("500m-1km", "30-50k", "Bún", "Trưa")),
+    ]
+    for label, choice in cases:
+        rowwise_time, expected = timed(filter_rowwise, df, *choice)
+        vector_time, result = timed(filter_vectorized, encoded, *choice)
+        assert expected.index.equals(result.index), label
+        print(f"    {label:<14} apply {rowwise_time * 1000:9.1f} ms   mask {vector_time * 1000:7.1f} ms"
+              f"   x{rowwise_time / vector_time:.0f}   ({len(result)} quán)")
+
+
+def bench_charts(rows):
+    stats_time, stats = timed(DatasetStats, app5_frame(rows), repeat=1)
+    print(f"{rows} quán: thống kê {stats_time * 1000:.1f} ms, biểu đồ khoảng cách - giá: {stats.scatter_mode}")
+    for chart in charts.CHARTS:
+        build_time, fig = timed(charts.stats_figure, stats, chart)
+        # Streamlit gửi figure xuống trình duyệt dưới dạng JSON
+        json_time, spec = timed(lambda: fig.to_json(validate=False))
+        print(f"    {chart:<8} dựng {build_time * 1000:7.1f} ms   JSON {json_time * 1000:6.1f} ms"
+              f"   {len(spec) / 1024:8.1f} KB")
+
+
+def catalogue_frame(catalogue):
+    """DataFrame theo cấu trúc của app5 dựng từ một ``Catalogue`` của app chính."""
+    return filters.encode_list_columns(pd.DataFrame({
+        "name": [r["name"] for r in catalogue.restaurants],
+        # Điểm giữa khoảng cách (mét) -> km như app5
+        "distance": [sum(b) / 2000 if b is not None else np.nan for b in catalogue.distances.bounds],
+        "avg_price": catalogue.prices.median,
+        # app5 quán nào cũng có đánh giá: dùng điểm Bayes, có cả với quán chưa có review
+        "rating": np.round(catalogue.ratings.bayes, 1),
+        "food_type": [r.get("type", []) for r in catalogue.restaurants],
+        "meals": [r.get("time", []) for r in catalogue.restaurants],
+    }))
+
+
+def _report(label, seconds, note=""):
+    print(f"    {label:<28} {seconds * 1000:10.2f} ms   {note}", flush=True)
+
+
+def _render_detail(catalogue, restaurant):
+    # Các chuỗi HTML mà render_detail dựng cho một quán
+    pos = catalogue.positions_by_id[restaurant["id"]]
+    return (templates.detail_header(restaurant)
+            + templates.info_grid([("Khoảng cách:", restaurant["distance"]),
+                                   ("Mức giá:", restaurant["price"]),
+                                   ("Giờ mở cửa:", restaurant["hours"]),
+                                   ("Đánh giá:", templates.rating_text(*catalogue.ratings.summary(pos)))],
+                                  wide_items=[("Loại món:", ", ".join(restaurant["type"]))])
+            + templates.menu_list(restaurant["menu"])
+            + templates.review_list(restaurant["reviews"]))
+
+
+def bench_suite(rows):
+    print(f"{rows} quán", flush=True)
+    generate_time, records = timed(synthetic.generate, rows, repeat=1)
+    _report("sinh dữ liệu", generate_time)
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "restaurants.db")
+        save_time, version = timed(data_store.save_restaurants, records, path, repeat=1)
+        _report("lưu SQLite", save_time, f"{os.path.getsize(path) / 2**20:.1f} MB")
+        del records
+        load_time, records = timed(data_store.load_restaurants, path, repeat=1)
+        _report("nạp dữ liệu", load_time)
+    build_time, catalogue = timed(Catalogue, records, version, repeat=1)
+    _report("dựng Catalogue", build_time)
+
+    # Trang "Tìm quán": mỗi đường lọc như render_search gọi
+    cases = [
+        ("không lọc", lambda: catalogue.filter()),
+        ("khoảng cách <500m", lambda: catalogue.filter([("distance", "<500m")])),
+        ("khoảng cách tùy chỉnh", lambda: catalogue.filter(distance_range=(0, 500))),
+        ("mức giá 30-40k", lambda: catalogue.filter([("price", "30-40k")])),
+        ("loại món", lambda: catalogue.filter([("type", "Đồ Hàn")])),
+        ("thời gian", lambda: catalogue.filter([("time", "Trưa")])),
+        ("đang mở cửa", lambda: catalogue.filter(open_minute=12 * 60)),
+        ("cả năm bộ lọc", lambda: catalogue.filter(
+            [("distance", "<500m"), ("price", "30-40k"), ("type", "Bún/Phở/Miến/Bánh canh/Súp"),
+             ("time", "Trưa")], open_minute=12 * 60)),
+    ]
+    for label, run in cases:
+        seconds, positions = timed(run)
+        _report(label, seconds, f"{len(positions)} quán")
+    everything = catalogue.filter()
+    seconds, ranked = timed(catalogue.search, "bun bo", everything)
+    _report("tìm từ khóa", seconds, f"{len(ranked)} quán")
+    seconds, matches = timed(catalogue.suggest, "bun boo hueee", everything)
+    _report("gợi ý gần đúng", seconds, f"{len(matches)} gợi ý")
+    seconds, ordered = timed(catalogue.sort_by_rating, everything)
+    _report("sắp theo đánh giá", seconds)
+    seconds, _ = timed(lambda: [templates.restaurant_card(catalogue.restaurants[pos], catalogue.ratings.summary(pos))
+                                for pos in ordered[:10]])
+    _report("thẻ quán một trang", seconds)
+
+    # Trang chi tiết: quán có tọa độ đầu tiên
+    restaurant = next(r for r in catalogue.restaurants if "lat" in r)
+    pos = catalogue.positions_by_id[restaurant["id"]]
+    seconds, _ = timed(lambda: _render_detail(catalogue, catalogue.get(restaurant["id"])))
+    _report("chi tiết quán", seconds)
+    seconds, _ = timed(catalogue.geo.nearest, restaurant["lat"], restaurant["lng"], 5)
+    _report("quán lân cận", seconds)
+    if rows <= SIMILAR_LIMIT:
+        build_time, index = timed(SimilarIndex, catalogue, repeat=1)
+        _report("dựng bảng quán tương tự", build_time)
+        seconds, _ = timed(index.similar, pos, 4)
+        _report("quán tương tự", seconds)
+        del index
+    else:
+        print(f"    {'quán tương tự':<28} bỏ qua (trên {SIMILAR_LIMIT} quán)", flush=True)
+    build_time, recommender = timed(Recommender, catalogue, 12 * 60, repeat=1)
+    _report("dựng gợi ý hôm nay", build_time)
+    seconds, _ = timed(recommender.top, 6, 12 * 60)
+    _report("gợi ý top 6", seconds)
+    seconds, _ = timed(recommender.surprise, 12 * 60)
+    _report("chọn ngẫu nhiên", seconds)
+    del recommender
+
+    # Trang thống kê của app5 trên cùng danh mục
+    frame_time, df = timed(catalogue_frame, catalogue, repeat=1)
+    _report("đổi sang bảng app5", frame_time)
+    del catalogue, records
+    stats_time, stats = timed(DatasetStats, df, repeat=1)
+    _report("thống kê app5", stats_time, stats.scatter_mode)
+    for chart in charts.CHARTS:
+        seconds, spec = timed(lambda: charts.stats_figure(stats, chart).to_json(validate=False))
+        _report(f"biểu đồ {chart} + JSON", seconds, f"{len(spec) / 1024:.1f} KB")
+
+
+COMMANDS = {
+    "filters": (bench_filters, [10_000, 1_000_000]),
+    "charts": (bench_charts, [500, 5_000, 100_000, 1_000_000]),
+    "suite": (bench_suite, [100, 10_000, 100_000]),
+}
+
+
+def main(argv):
+    if len(argv) < 2 or argv[1] not in COMMANDS or not all(arg.isdigit() for arg in argv[2:]):
+        print(__doc__)
+        return 1
+    bench, default_rows = COMMANDS[argv[1]]
+    for rows in [int(arg) for arg in argv[2:]] or default_rows:
+        bench(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
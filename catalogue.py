@@ -0,0 +1,489 @@
+"""Danh mục quán ăn cùng các chỉ mục được tính sẵn.
+
+Mỗi phiên bản dữ liệu chỉ dựng một ``Catalogue``; các trang chỉ tra cứu chỉ
+mục chứ không duyệt lại toàn bộ danh sách quán. Các chỉ mục làm việc với vị
+trí (0, 1, 2...) của quán trong ``Catalogue.restaurants``.
+
+Một ``Catalogue`` không bị sửa sau khi dựng xong. Khi có quán được thêm/sửa,
+``updated`` tạo bản mới chỉ đọc lại các quán đó và dùng lại phần còn lại của
+các chỉ mục; ``LiveCatalogue`` thay bản cũ bằng bản mới trong một phép gán.
+"""
+
+import copy
+import threading
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+import data_store
+from fuzzy import FuzzyIndex
+from geo import GeoIndex
+from parsing import MINUTES_PER_DAY, parse_distance, parse_hours, parse_price
+from text_search import TextIndex, tokenize
+
+# Khoảng (mét, tính cả hai đầu) tương ứng các lựa chọn trong bộ lọc
+DISTANCE_BUCKETS = {
+    "<500m": (0, 499),
+    "500m-1km": (500, 999),
+    "1-2km": (1000, 2000),
+}
+
+# Khoảng giá (nghìn đồng, [thấp, cao)) tương ứng các lựa chọn trong bộ lọc
+PRICE_BUCKETS = {
+    "<30k": (0, 30),
+    "30-40k": (30, 40),
+    "40-50k": (40, 50),
+    ">50k": (50, float("inf")),
+}
+
+# Quán ghi "Cả ngày" được tính là phục vụ ở mọi khung giờ
+TIME_SLOTS = ("Sáng", "Trưa", "Chiều", "Tối", "Khuya")
+ALL_DAY_SLOT = "Cả ngày"
+
+
+# Bitset: mảng uint8 đã packbits, bit thứ i ứng với quán ở vị trí i
+def to_bitset(positions, size):
+    mask = np.zeros(size, dtype=bool)
+    mask[positions] = True
+    return np.packbits(mask)
+
+
+def to_positions(bits, size):
+    return np.flatnonzero(np.unpackbits(bits, count=size))
+
+
+class DistanceIndex:
+    """Khoảng cách đã sắp xếp để tìm các quán trong một khoảng bằng bisect."""
+
+    def __init__(self, restaurants):
+        # (min_m, max_m) của từng quán, None nếu không đọc được
+        self.bounds = [parse_distance(r.get("distance")) for r in restaurants]
+        self._sort()
+
+    def updated(self, restaurants, changed):
+        """Bản mới sau khi các quán ở vị trí ``changed`` được thêm/sửa."""
+        new = copy.copy(self)
+        new.bounds = self.bounds + [None] * (len(restaurants) - len(self.bounds))
+        for pos in changed:
+            new.bounds[pos] = parse_distance(restaurants[pos].get("distance"))
+        new._sort()
+        return new
+
+    def _sort(self):
+        # Mỗi quán được xếp theo điểm giữa khoảng, VD "200-300m" -> 250m
+        entries = []
+        for pos, bound in enumerate(self.bounds):
+            if bound is not None:
+                entries.append((sum(bound) // 2, pos))
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.positions = [pos for _, pos in entries]
+
+    def range(self, low, high):
+        # Vị trí các quán có khoảng cách trong [low, high] mét
+        start = bisect_left(self.keys, low)
+        end = bisect_right(self.keys, high)
+        return self.positions[start:end]
+
+    def max_distance(self):
+        return self.keys[-1] if self.keys else 0
+
+
+class PriceTable:
+    """Giá từng món đã đọc thành số và thống kê giá (min, trung vị, max) mỗi quán.
+
+    Quán chưa có menu có giá lấy từ mức giá nhập tay ("<30k", "30-50k"...), đánh
+    dấu trong ``from_label``.
+    """
+
+    def __init__(self, restaurants):
+        self.dishes = [self._dishes(r) for r in restaurants]
+
+        stats = [self._stats(r, dishes) for r, dishes in zip(restaurants, self.dishes)]
+        stats = np.array(stats, dtype=float).reshape(len(restaurants), 4)
+        self.min = stats[:, 0]
+        self.median = stats[:, 1]
+        self.max = stats[:, 2]
+        self.from_label = stats[:, 3] > 0
+
+    def updated(self, restaurants, changed):
+        """Bản mới sau khi các quán ở vị trí ``changed`` được thêm/sửa."""
+        new = copy.copy(self)
+        grow = len(restaurants) - len(self.dishes)
+        new.dishes = self.dishes + [[] for _ in range(grow)]
+        pad = np.full(grow, np.nan)
+        new.min, new.median, new.max = (np.concatenate([column, pad])
+                                        for column in (self.min, self.median, self.max))
+        new.from_label = np.concatenate([self.from_label, np.zeros(grow, dtype=bool)])
+        for pos in changed:
+            new.dishes[pos] = self._dishes(restaurants[pos])
+            new.min[pos], new.median[pos], new.max[pos], new.from_label[pos] = self._stats(
+                restaurants[pos], new.dishes[pos])
+        return new
+
+    @staticmethod
+    def _dishes(restaurant):
+        return [parse_price(item.get("price")) for item in restaurant.get("menu", [])]
+
+    @staticmethod
+    def _stats(restaurant, dishes):
+        prices = [p for p in dishes if p is not None]
+        # Món tính theo xiên/quả/lon... không phải giá một suất ăn
+        per_portion = [p for p in prices if not p.unit] or prices
+        if per_portion:
+            values = [(p.min_k + p.max_k) / 2 for p in per_portion]
+            return (min(p.min_k for p in per_portion), float(np.median(values)),
+                    max(p.max_k for p in per_portion), False)
+
+        # Không có menu: dùng mức giá nhập tay của quán ("30-40k", "<30k", ">50k"...)
+        bucket = parse_price(restaurant.get("price"))
+        if bucket is None:
+            return (np.nan, np.nan, np.nan, False)
+        # ">50k" không có đầu trên: lấy đầu dưới làm giá tiêu biểu
+        median = bucket.min_k if np.isinf(bucket.max_k) else (bucket.min_k + bucket.max_k) / 2
+        return (bucket.min_k, median, bucket.max_k, True)
+
+    def mask(self, low, high):
+        # Quán có giá trung vị trong [low, high); NaN luôn cho False. Quán chỉ có mức
+        # giá nhập tay thuộc mọi khoảng giao với mức giá đó ("30-50k" -> 30-40k và 40-50k)
+        in_range = (self.median >= low) & (self.median < high)
+        overlaps = self.from_label & (self.min < high) & (self.max > low)
+        return in_range | overlaps
+
+
+class OpeningHours:
+    """Bitmap mở cửa theo từng phút trong ngày cho cả danh mục.
+
+    ``bits[m]`` là bitset (đã packbits) các quán đang mở ở phút thứ ``m``, nên
+    "đang mở cửa" hay "mở lúc HH:MM" chỉ là tra một dòng của bitmap.
+    """
+
+    # Dựng bitmap theo từng khối quán để không phải giữ ma trận bool 1440 x n
+    CHUNK = 4096
+
+    def __init__(self, restaurants):
+        self.size = len(restaurants)
+        self.intervals = [parse_hours(r.get("hours")) for r in restaurants]
+
+        self.bits = np.zeros((MINUTES_PER_DAY, (self.size + 7) // 8), dtype=np.uint8)
+        for first in range(0, self.size, self.CHUNK):
+            chunk = self.intervals[first:first + self.CHUNK]
+            is_open = np.zeros((MINUTES_PER_DAY, len(chunk)), dtype=bool)
+            for offset, intervals in enumerate(chunk):
+                for start, end in intervals or ():
+                    is_open[start:end, offset] = True
+            packed = np.packbits(is_open, axis=1)
+            self.bits[:, first // 8:first // 8 + packed.shape[1]] = packed
+
+    def updated(self, restaurants, changed):
+        """Bản mới sau khi các quán ở vị trí ``changed`` được thêm/sửa."""
+        new = copy.copy(self)
+        new.size = len(restaurants)
+        new.intervals = self.intervals + [None] * (new.size - self.size)
+        new.bits = np.zeros((MINUTES_PER_DAY, (new.size + 7) // 8), dtype=np.uint8)
+        new.bits[:, :self.bits.shape[1]] = self.bits
+        for pos in changed:
+            new.intervals[pos] = parse_hours(restaurants[pos].get("hours"))
+            # Chỉ sửa cột bit của quán này (packbits: bit cao nhất là vị trí đầu)
+            byte, bit = divmod(pos, 8)
+            mask = np.uint8(0x80 >> bit)
+            new.bits[:, byte] &= ~mask
+            for start, end in new.intervals[pos] or ():
+                new.bits[start:end, byte] |= mask
+        return new
+
+    def open_mask(self, minute):
+        # Mask bool các quán mở cửa ở phút thứ `minute` trong ngày
+        row = self.bits[minute % MINUTES_PER_DAY]
+        return np.unpackbits(row, count=self.size).astype(bool)
+
+    def open_at(self, hour, minute=0):
+        return self.open_mask(hour * 60 + minute)
+
+
+class RatingStats:
+    """Thống kê sao từ review của từng quán và thứ tự quán theo đánh giá.
+
+    ``histogram[i, j]`` là số review ``LEVELS[j]`` sao của quán ở vị trí i; form đóng
+    góp cho chấm nửa sao nên mỗi nửa sao từ 1 đến 5 là một cột. Điểm Bayes kéo
+    trung bình của quán ít review về trung bình chung, như thể mỗi quán có thêm
+    ``PRIOR_REVIEWS`` review ở mức trung bình chung, để quán chỉ có một review 5 sao
+    không đứng trên quán có hai mươi review 4.8 sao.
+    """
+
+    STARS = 5
+    # Các mức sao 1, 1.5, ..., 5
+    LEVELS = np.arange(2, 2 * STARS + 1) / 2
+    PRIOR_REVIEWS = 3
+    # Trung bình chung khi cả danh mục chưa có review nào
+    DEFAULT_PRIOR = 4.0
+
+    def __init__(self, restaurants):
+        self.histogram = np.zeros((len(restaurants), len(self.LEVELS)), dtype=np.int64)
+        for pos, r in enumerate(restaurants):
+            self.histogram[pos] = self._histogram(r)
+        self._aggregate()
+
+    def updated(self, restaurants, changed):
+        """Bản mới sau khi các quán ở vị trí ``changed`` được thêm/sửa."""
+        new = copy.copy(self)
+        new.histogram = np.zeros((len(restaurants), len(self.LEVELS)), dtype=np.int64)
+        new.histogram[:len(self.histogram)] = self.histogram
+        for pos in changed:
+            new.histogram[pos] = self._histogram(restaurants[pos])
+        new._aggregate()
+        return new
+
+    @classmethod
+    def _histogram(cls, restaurant):
+        counts = np.zeros(len(cls.LEVELS), dtype=np.int64)
+        for review in restaurant.get("reviews", []):
+            # Số nửa sao: 4.5 sao -> 9; điểm lẻ hơn được làm tròn tới nửa sao gần nhất
+            halves = round(float(review.get("rating", 0)) * 2)
+            if 2 <= halves <= 2 * cls.STARS:
+                counts[halves - 2] += 1
+        return counts
+
+    def _aggregate(self):
+        # Mọi giá trị suy ra từ histogram đều tính bằng numpy cho cả danh mục, nên
+        # dù review mới làm đổi trung bình chung, cập nhật vẫn chỉ là vài phép tính mảng
+        self.count = self.histogram.sum(axis=1)
+        total = self.histogram @ self.LEVELS
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.mean = total / self.count
+        reviews = self.count.sum()
+        self.prior = total.sum() / reviews if reviews else self.DEFAULT_PRIOR
+        self.bayes = (self.PRIOR_REVIEWS * self.prior + total) / (self.PRIOR_REVIEWS + self.count)
+        # Thứ tự sắp sẵn: điểm Bayes giảm dần, rồi nhiều review hơn, rồi vị trí
+        positions = np.arange(len(self.count))
+        self.order = np.lexsort((positions, -self.count, -self.bayes))
+        # rank[pos]: thứ hạng của quán, để sắp một tập con mà không phải so điểm
+        self.rank = np.empty_like(self.order)
+        self.rank[self.order] = positions
+
+    def sort(self, positions):
+        """``positions`` xếp theo đánh giá (tốt nhất trước)."""
+        positions = np.asarray(positions, dtype=np.int64)
+        return positions[np.argsort(self.rank[positions], kind="stable")]
+
+    def summary(self, pos):
+        # (trung bình, số review), trung bình là None nếu chưa có review
+        count = int(self.count[pos])
+        return (float(self.mean[pos]) if count else None, count)
+
+
+class TagIndex:
+    """Chỉ mục ngược từ giá trị tag (loại món, khung giờ, mức giá, khoảng cách) tới bitset quán.
+
+    Kết hợp nhiều bộ lọc chỉ là AND các bitset, không phải duyệt lại danh sách quán.
+    """
+
+    def __init__(self, restaurants, distances, prices):
+        self.size = len(restaurants)
+        postings = {}
+
+        for pos, r in enumerate(restaurants):
+            for value in r.get("type", []):
+                postings.setdefault(("type", value), []).append(pos)
+            slots = r.get("time", [])
+            if ALL_DAY_SLOT in slots:
+                slots = list(slots) + list(TIME_SLOTS)
+            for value in set(slots):
+                postings.setdefault(("time", value), []).append(pos)
+
+        for label, (low, high) in DISTANCE_BUCKETS.items():
+            postings[("distance", label)] = distances.range(low, high)
+        for label, (low, high) in PRICE_BUCKETS.items():
+            postings[("price", label)] = np.flatnonzero(prices.mask(low, high))
+
+        self.bitsets = {key: to_bitset(positions, self.size) for key, positions in postings.items()}
+        self._empty = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+        self._all = np.packbits(np.ones(self.size, dtype=bool))
+
+    def get(self, field, value):
+        return self.bitsets.get((field, value), self._empty)
+
+    def all(self):
+        return self._all.copy()
+
+    def values(self, field):
+        return sorted(value for f, value in self.bitsets if f == field)
+
+
+class Catalogue:
+    # Ngưỡng ghép gợi ý gần đúng vào kết quả tìm kiếm, xem search_with_suggestions
+    FEW_RESULTS = 3
+    STRONG_POOL = 10
+    # Đã có kết quả chính xác thì chỉ ghép gợi ý gần đúng đủ giống (điểm 0..1)
+    SUGGESTION_SCORE = 0.75
+
+    def __init__(self, restaurants, version=0):
+        self.restaurants = restaurants
+        self.version = version
+        # id (khóa chính trong kho dữ liệu, không đổi giữa các phiên bản) -> vị trí
+        self.positions_by_id = {r["id"]: pos for pos, r in enumerate(restaurants) if "id" in r}
+        self.distances = DistanceIndex(restaurants)
+        self.prices = PriceTable(restaurants)
+        self.hours = OpeningHours(restaurants)
+        self.ratings = RatingStats(restaurants)
+        self.tags = TagIndex(restaurants, self.distances, self.prices)
+        self.text = TextIndex(restaurants)
+        self.fuzzy = FuzzyIndex(restaurants)
+        # Quán chưa có tọa độ mang NaN và không xuất hiện trong kết quả tìm theo vị trí
+        self.geo = GeoIndex(*self._coordinates(restaurants))
+
+    @staticmethod
+    def _coordinates(restaurants):
+        return ([r.get("lat", np.nan) for r in restaurants],
+                [r.get("lng", np.nan) for r in restaurants])
+
+    def updated(self, records, version):
+        """Danh mục mới sau khi thêm/sửa các quán ``records`` (bản ghi đầy đủ, có "id").
+
+        Quán có id đã biết giữ nguyên vị trí, quán mới được thêm vào cuối. Chỉ các
+        quán này được đọc lại; bản hiện tại không bị thay đổi.
+        """
+        restaurants = list(self.restaurants)
+        positions_by_id = dict(self.positions_by_id)
+        changed = []
+        for record in records:
+            pos = positions_by_id.get(record["id"])
+            if pos is None:
+                pos = positions_by_id[record["id"]] = len(restaurants)
+                restaurants.append(record)
+            else:
+                restaurants[pos] = record
+            changed.append(pos)
+
+        new = copy.copy(self)
+        new.restaurants = restaurants
+        new.version = version
+        new.positions_by_id = positions_by_id
+        new.distances = self.distances.updated(restaurants, changed)
+        new.prices = self.prices.updated(restaurants, changed)
+        new.hours = self.hours.updated(restaurants, changed)
+        new.ratings = self.ratings.updated(restaurants, changed)
+        # Bitset tag dựng lại từ các trường đã có sẵn, không phải đọc lại chuỗi nào
+        new.tags = TagIndex(restaurants, new.distances, new.prices)
+        new.text = self.text.updated(restaurants, changed)
+        new.fuzzy = self.fuzzy.updated(restaurants, changed)
+        new.geo = self.geo.updated(*self._coordinates(restaurants), changed)
+        return new
+
+    def filter(self, tags=(), distance_range=None, open_minute=None):
+        """Vị trí các quán thỏa mọi điều kiện, theo thứ tự trong danh mục.
+
+        ``tags`` là các cặp (field, value) như ("type", "Đồ Hàn"), ("price", "<30k").
+        """
+        bits = self.tags.all()
+        for field, value in tags:
+            bits &= self.tags.get(field, value)
+        if distance_range is not None:
+            bits &= to_bitset(self.distances.range(*distance_range), len(self))
+        if open_minute is not None:
+            bits &= self.hours.bits[open_minute % MINUTES_PER_DAY]
+        return to_positions(bits, len(self))
+
+    def __len__(self):
+        return len(self.restaurants)
+
+    def get(self, restaurant_id):
+        """Bản ghi của quán theo id, hoặc None nếu không còn trong danh mục."""
+        pos = self.positions_by_id.get(restaurant_id)
+        return None if pos is None else self.restaurants[pos]
+
+    def search(self, query, positions=None, limit=None):
+        """Vị trí các quán khớp truy vấn, xếp theo độ liên quan.
+
+        Nếu có ``positions`` (kết quả của ``filter``) thì chỉ giữ các quán trong đó.
+        """
+        ranked = [pos for pos, _ in self.text.search(query)]
+        if positions is not None:
+            allowed = np.zeros(len(self), dtype=bool)
+            allowed[positions] = True
+            ranked = [pos for pos in ranked if allowed[pos]]
+        return ranked[:limit] if limit else ranked
+
+    def sort_by_rating(self, positions):
+        """Vị trí trong ``positions`` xếp theo đánh giá, dùng thứ tự đã sắp sẵn."""
+        return self.ratings.sort(positions)
+
+    def search_with_suggestions(self, query, positions=None):
+        """(vị trí các quán, gợi ý gần đúng đã được ghép vào kết quả).
+
+        Khớp chính xác ít hơn ``FEW_RESULTS`` quán thì thêm các quán gần đúng vào sau;
+        khớp yếu (không quán nào trong ``STRONG_POOL`` quán đầu có đủ mọi từ trong tên
+        quán hay một tên món, VD chỉ khớp "bánh" trong review) thì đưa các quán gần
+        đúng lên trước. Không có kết quả chính xác thì chỉ còn kết quả gần đúng.
+        """
+        ranked = self.search(query, positions)
+        strong = any(self._names_match(pos, query) for pos in ranked[:self.STRONG_POOL])
+        if strong and len(ranked) >= self.FEW_RESULTS:
+            return ranked, []
+        suggestions = self.suggest(query, positions)
+        if ranked:
+            suggestions = [match for match in suggestions if match.score >= self.SUGGESTION_SCORE]
+        similar = list(dict.fromkeys(pos for match in suggestions for pos in match.positions))
+        first, second = (ranked, similar) if strong else (similar, ranked)
+        return list(dict.fromkeys(first + second)), suggestions
+
+    def _names_match(self, pos, query):
+        # Tên quán hoặc một tên món có mọi từ của truy vấn (từ cuối đang gõ: theo tiền tố)
+        tokens = tokenize(query)
+        if not tokens:
+            return False
+        restaurant = self.restaurants[pos]
+        names = [restaurant.get("name", "")] + [item.get("dish", "") for item in restaurant.get("menu", [])]
+        for name in names:
+            words = tokenize(name)
+            if all(token in words for token in tokens[:-1]) and any(w.startswith(tokens[-1]) for w in words):
+                return True
+        return False
+
+    def suggest(self, query, positions=None, limit=5):
+        """Món/quán gần giống truy vấn (chấp nhận gõ sai), chỉ giữ các quán trong ``positions``."""
+        matches = self.fuzzy.match(query, limit=None if positions is not None else limit)
+        if positions is not None:
+            allowed = np.zeros(len(self), dtype=bool)
+            allowed[positions] = True
+            matches = [m._replace(positions=[p for p in m.positions if allowed[p]]) for m in matches]
+            matches = [m for m in matches if m.positions][:limit]
+        return matches
+
+
+class LiveCatalogue:
+    """Danh mục hiện hành của process, theo kịp kho dữ liệu mà không cần khởi động lại.
+
+    Mỗi lần chạy script lấy một ``snapshot()`` và dùng nó từ đầu đến cuối. Khi kho
+    dữ liệu có phiên bản mới, chỉ các quán ghi sau phiên bản đang có được nạp và
+    đánh chỉ mục, rồi bản mới thay bản cũ; session đang dùng bản cũ vẫn thấy dữ
+    liệu nhất quán.
+    """
+
+    def __init__(self, path=data_store.DB_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.current = self._load()
+
+    def _load(self):
+        version, records, _ = data_store.load_changes(-1, self.path)
+        return Catalogue(records, version)
+
+    def snapshot(self):
+        current = self.current
+        if data_store.data_version(self.path) == current.version:
+            return current
+        with self.lock:
+            # Session khác có thể đã cập nhật trong lúc chờ khóa
+            current = self.current
+            version, records, ids = data_store.load_changes(current.version, self.path)
+            if version == current.version:
+                return current
+            removed = len(current.positions_by_id.keys() - set(ids)) > 0
+            if removed or 2 * len(records) > len(ids):
+                # Có quán bị xóa (vị trí phải dồn lại) hoặc đổi gần hết: dựng lại từ đầu
+                current = self._load()
+            else:
+                current = current.updated(records, version)
+            self.current = current
+            return current
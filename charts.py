@@ -0,0 +1,81 @@
+"""Dựng các biểu đồ Plotly của trang "📊 Thống kê" (app5) từ ``stats.DatasetStats``.
+
+Biểu đồ khoảng cách - giá đổi cách vẽ theo ``DatasetStats.scatter_mode``: SVG
+từng điểm với dữ liệu nhỏ, WebGL (scattergl) khi nhiều điểm, và heatmap của lưới
+đã gộp sẵn trên server khi quá nhiều điểm, để dung lượng gửi xuống trình duyệt
+và thời gian vẽ luôn có giới hạn.
+"""
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+CHARTS = ("types", "prices", "meals", "scatter")
+
+
+def stats_figure(stats, chart):
+    if chart == "types":
+        return px.pie(
+            values=stats.type_counts.values,
+            names=stats.type_counts.index,
+            title="Các loại món phổ biến",
+            color_discrete_sequence=px.colors.qualitative.Set3
+        )
+    if chart == "prices":
+        # Histogram đã được đếm sẵn: chỉ gửi số quán mỗi bin, không gửi cả cột giá
+        edges = stats.price_edges
+        fig = px.bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=stats.price_counts,
+            title="Phân bố mức giá trung bình",
+            labels={'x': 'Giá (nghìn đồng)', 'y': 'Số quán'},
+            color_discrete_sequence=['#FF6B6B']
+        )
+        fig.update_traces(width=edges[1] - edges[0])
+        return fig
+    if chart == "meals":
+        return px.bar(
+            x=stats.meal_counts.index,
+            y=stats.meal_counts.values,
+            title="Số quán phù hợp theo khung giờ",
+            labels={'x': 'Bữa ăn', 'y': 'Số quán'},
+            color=stats.meal_counts.values,
+            color_continuous_scale='Viridis'
+        )
+    if chart == "scatter":
+        if stats.scatter_mode == "binned":
+            return _binned_scatter(stats.scatter_bins)
+        return px.scatter(
+            stats.scatter,
+            x='distance',
+            y='avg_price',
+            size='rating',
+            color='rating',
+            hover_data=['name'],
+            title="Khoảng cách vs Giá (Size: Đánh giá)",
+            labels={'distance': 'Khoảng cách (km)', 'avg_price': 'Giá TB (nghìn đồng)'},
+            color_continuous_scale='RdYlGn',
+            render_mode="webgl" if stats.scatter_mode == "webgl" else "svg"
+        )
+    raise ValueError(f"Không có biểu đồ {chart}")
+
+
+def _binned_scatter(bins):
+    x_edges, y_edges, counts, ratings = bins
+    fig = go.Figure(go.Heatmap(
+        x=(x_edges[:-1] + x_edges[1:]) / 2,
+        y=(y_edges[:-1] + y_edges[1:]) / 2,
+        # Ô không có quán để trống thay vì tô màu 0; heatmap lấy z theo [y][x]
+        z=np.where(counts > 0, counts, np.nan).T,
+        customdata=ratings.T,
+        colorscale='Viridis',
+        colorbar={'title': 'Số quán'},
+        hovertemplate=("Khoảng cách %{x:.2f} km<br>Giá %{y:.0f}k<br>%{z:.0f} quán"
+                       "<br>Đánh giá TB %{customdata:.1f}<extra></extra>"),
+    ))
+    fig.update_layout(
+        title="Khoảng cách vs Giá (Màu: số quán)",
+        xaxis_title='Khoảng cách (km)',
+        yaxis_title='Giá TB (nghìn đồng)',
+    )
+    return fig
@@ -0,0 +1,191 @@
+"""Lưu đóng góp quán ăn của người dùng (SQLite, chế độ WAL).
+
+Các session không tự mở kết nối ghi: mỗi process có một ``ContributionWriter``
+chạy một thread ghi duy nhất, gom các đóng góp đang chờ thành từng lô và ghi mỗi
+lô trong một transaction. Session gửi đóng góp chỉ đợi lô chứa đóng góp của
+mình được commit, không chặn rerun của các session khác. WAL cho phép đọc (trang
+kiểm duyệt, app khác) trong khi đang ghi.
+"""
+
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timezone
+
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "contributions.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contributions (
+    id         INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    source     TEXT NOT NULL,
+    name       TEXT NOT NULL,
+    address    TEXT NOT NULL,
+    payload    TEXT NOT NULL DEFAULT '{}',
+    status     TEXT NOT NULL DEFAULT 'pending',
+    restaurant_id INTEGER
+)
+"""
+
+# Cột được thêm sau khi bảng đã có dữ liệu: (tên cột, kiểu)
+MIGRATIONS = [
+    # Quán trong kho dữ liệu được tạo/gộp từ đóng góp này khi kiểm duyệt
+    ("restaurant_id", "INTEGER"),
+]
+
+# Trạng thái: chờ duyệt -> đã thêm thành quán mới / đã gộp vào quán có sẵn / bị từ chối
+STATUSES = ("pending", "approved", "merged", "rejected")
+
+# Một lô ghi tối đa BATCH_SIZE đóng góp, đợi thêm tối đa FLUSH_INTERVAL giây
+# sau đóng góp đầu tiên để gom các đóng góp gửi gần như cùng lúc
+BATCH_SIZE = 100
+FLUSH_INTERVAL = 0.05
+# Thời gian session đợi đóng góp của mình được ghi xong
+SUBMIT_TIMEOUT = 10
+
+COLUMNS = ("id", "created_at", "source", "name", "address", "payload", "status", "restaurant_id")
+
+
+def connect(path=DB_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # Với WAL, synchronous=NORMAL vẫn bền khi app bị tắt đột ngột, chỉ có thể mất
+    # lô cuối nếu mất điện cả máy
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(SCHEMA)
+    _migrate(conn)
+    return conn
+
+
+def _migrate(conn):
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(contributions)")}
+    for column, kind in MIGRATIONS:
+        if column not in existing:
+            conn.execute(f"ALTER TABLE contributions ADD COLUMN {column} {kind}")
+
+
+def _row_to_record(row):
+    record = dict(zip(COLUMNS, row))
+    record["payload"] = json.loads(record["payload"])
+    return record
+
+
+def load_contributions(status=None, path=DB_PATH):
+    conn = connect(path)
+    try:
+        if status is None:
+            rows = conn.execute(f"SELECT {', '.join(COLUMNS)} FROM contributions ORDER BY id").fetchall()
+        else:
+            rows = conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM contributions WHERE status = ? ORDER BY id",
+                (status,),
+            ).fetchall()
+    finally:
+        conn.close()
+    return [_row_to_record(row) for row in rows]
+
+
+def load_contribution(contribution_id, path=DB_PATH):
+    conn = connect(path)
+    try:
+        row = conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM contributions WHERE id = ?", (contribution_id,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return None if row is None else _row_to_record(row)
+
+
+def set_status(contribution_id, status, restaurant_id=None, path=DB_PATH):
+    if status not in STATUSES:
+        raise ValueError(f"Trạng thái không hợp lệ: {status}")
+    conn = connect(path)
+    try:
+        with conn:
+            conn.execute(
+                "UPDATE contributions SET status = ?, restaurant_id = ? WHERE id = ?",
+                (status, restaurant_id, contribution_id),
+            )
+    finally:
+        conn.close()
+
+
+class ContributionWriter:
+    """Thread ghi duy nhất của process; ``submit`` an toàn khi gọi từ nhiều session."""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self.pending = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="contribution-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def submit(self, source, name, address, payload):
+        """Đưa một đóng góp vào hàng đợi; trả về Future nhận id khi đã commit."""
+        future = Future()
+        row = (
+            datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            source,
+            name.strip(),
+            address.strip(),
+            json.dumps(payload, ensure_ascii=False),
+        )
+        self.pending.put((row, future))
+        return future
+
+    def close(self):
+        # Ghi nốt các đóng góp còn trong hàng đợi rồi dừng thread
+        if self.thread.is_alive():
+            self.pending.put(None)
+            self.thread.join()
+
+    def _next_batch(self):
+        first = self.pending.get()
+        if first is None:
+            return None
+        batch = [first]
+        while len(batch) < BATCH_SIZE:
+            try:
+                item = self.pending.get(timeout=FLUSH_INTERVAL)
+            except queue.Empty:
+                break
+            if item is None:
+                # Dừng sau khi ghi lô này
+                self.pending.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        conn = connect(self.path)
+        try:
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    return
+                self._write(conn, batch)
+        finally:
+            conn.close()
+
+    def _write(self, conn, batch):
+        try:
+            with conn:
+                ids = [
+                    conn.execute(
+                        "INSERT INTO contributions (created_at, source, name, address, payload)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        row,
+                    ).lastrowid
+                    for row, _ in batch
+                ]
+        except sqlite3.Error as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, future), contribution_id in zip(batch, ids):
+            future.set_result(contribution_id)
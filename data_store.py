@@ -0,0 +1,222 @@
+"""Kho dữ liệu quán ăn (SQLite).
+
+Dữ liệu quán được lưu trong ``data/restaurants.db`` thay vì viết thẳng trong
+script Streamlit. Phiên bản dữ liệu được lưu bằng ``PRAGMA user_version`` và
+tăng lên mỗi lần ghi, để app có thể dùng làm khóa cache.
+
+Dùng từ dòng lệnh để xuất/nhập JSON khi cần sửa dữ liệu bằng tay:
+
+    python data_store.py export restaurants.json
+    python data_store.py import restaurants.json
+"""
+
+import json
+import os
+import sqlite3
+import sys
+
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "restaurants.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS restaurants (
+    id       INTEGER PRIMARY KEY,
+    name     TEXT NOT NULL,
+    address  TEXT NOT NULL,
+    phone    TEXT,
+    distance TEXT NOT NULL DEFAULT '',
+    price    TEXT NOT NULL DEFAULT '',
+    type     TEXT NOT NULL DEFAULT '[]',
+    time     TEXT NOT NULL DEFAULT '[]',
+    hours    TEXT NOT NULL DEFAULT '',
+    menu     TEXT NOT NULL DEFAULT '[]',
+    reviews  TEXT NOT NULL DEFAULT '[]',
+    lat      REAL,
+    lng      REAL,
+    version  INTEGER
+)
+"""
+
+# Cột được thêm sau khi bảng đã có dữ liệu: (tên cột, kiểu)
+MIGRATIONS = [
+    ("lat", "REAL"),
+    ("lng", "REAL"),
+    # Phiên bản dữ liệu lần cuối quán được ghi, để app chỉ nạp lại các quán đã đổi
+    ("version", "INTEGER"),
+]
+
+# Các cột lưu dạng JSON (list/dict lồng nhau)
+JSON_COLUMNS = ("type", "time", "menu", "reviews")
+COLUMNS = ("id", "name", "address", "phone", "distance", "price",
+           "type", "time", "hours", "menu", "reviews", "lat", "lng")
+# Cột không bắt buộc: bỏ khỏi bản ghi nếu NULL
+OPTIONAL_COLUMNS = ("phone", "lat", "lng")
+
+
+def connect(path=DB_PATH, readonly=False):
+    if readonly:
+        return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute(SCHEMA)
+    _migrate(conn)
+    return conn
+
+
+def _migrate(conn):
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(restaurants)")}
+    for column, kind in MIGRATIONS:
+        if column not in existing:
+            conn.execute(f"ALTER TABLE restaurants ADD COLUMN {column} {kind}")
+
+
+def data_version(path=DB_PATH):
+    # Rất rẻ: chỉ đọc header của file, dùng làm khóa cache mỗi lần rerun
+    conn = connect(path, readonly=True)
+    try:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _row_to_record(row):
+    record = dict(zip(COLUMNS, row))
+    for col in JSON_COLUMNS:
+        record[col] = json.loads(record[col])
+    for col in OPTIONAL_COLUMNS:
+        if record[col] is None:
+            del record[col]
+    return record
+
+
+def load_restaurant(restaurant_id, path=DB_PATH):
+    conn = connect(path, readonly=True)
+    try:
+        row = conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM restaurants WHERE id = ?", (restaurant_id,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return None if row is None else _row_to_record(row)
+
+
+def load_changes(since_version, path=DB_PATH):
+    """(phiên bản hiện tại, các quán ghi sau ``since_version``, id mọi quán còn trong kho).
+
+    Đọc trong một transaction nên ba giá trị thuộc cùng một phiên bản dữ liệu.
+    """
+    conn = connect(path, readonly=True)
+    try:
+        conn.execute("BEGIN")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        rows = conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM restaurants WHERE IFNULL(version, 0) > ? ORDER BY id",
+            (since_version,),
+        ).fetchall()
+        ids = [row[0] for row in conn.execute("SELECT id FROM restaurants ORDER BY id")]
+        conn.rollback()
+    finally:
+        conn.close()
+    return version, [_row_to_record(row) for row in rows], ids
+
+
+def find_contribution(contribution_id, path=DB_PATH):
+    """Id quán đã nhận review của đóng góp ``contribution_id`` (None nếu chưa có quán nào)."""
+    conn = connect(path, readonly=True)
+    try:
+        row = conn.execute(
+            "SELECT restaurants.id FROM restaurants, json_each(restaurants.reviews) AS review"
+            " WHERE json_extract(review.value, '$.contribution_id') = ? LIMIT 1",
+            (contribution_id,),
+        ).fetchone()
+    finally:
+        conn.close()
+    return None if row is None else row[0]
+
+
+def load_restaurants(path=DB_PATH):
+    conn = connect(path, readonly=True)
+    try:
+        rows = conn.execute(f"SELECT {', '.join(COLUMNS)} FROM restaurants ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    return [_row_to_record(row) for row in rows]
+
+
+def _record_to_row(record):
+    return (
+        record.get("id"),
+        record["name"],
+        record["address"],
+        record.get("phone"),
+        record.get("distance", ""),
+        record.get("price", ""),
+        json.dumps(record.get("type", []), ensure_ascii=False),
+        json.dumps(record.get("time", []), ensure_ascii=False),
+        record.get("hours", ""),
+        json.dumps(record.get("menu", []), ensure_ascii=False),
+        json.dumps(record.get("reviews", []), ensure_ascii=False),
+        record.get("lat"),
+        record.get("lng"),
+    )
+
+
+def _bump_version(conn):
+    # Phải gọi trong transaction đã mở bằng BEGIN IMMEDIATE: sqlite3 không tự mở
+    # transaction cho PRAGMA, nếu không phiên bản mới được commit riêng trước khi
+    # quán được ghi và app có thể lấy phiên bản đó khi chưa thấy quán
+    version = conn.execute("PRAGMA user_version").fetchone()[0] + 1
+    conn.execute(f"PRAGMA user_version = {version}")
+    return version
+
+
+def save_restaurants(records, path=DB_PATH):
+    # Ghi đè toàn bộ danh sách quán, trả về phiên bản dữ liệu mới
+    conn = connect(path)
+    try:
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM restaurants")
+            version = _bump_version(conn)
+            conn.executemany(
+                f"INSERT INTO restaurants ({', '.join(COLUMNS)}, version) VALUES ({', '.join('?' * (len(COLUMNS) + 1))})",
+                [_record_to_row(r) + (version,) for r in records],
+            )
+            return version
+    finally:
+        conn.close()
+
+
+def save_restaurant(record, path=DB_PATH):
+    # Thêm một quán (record chưa có "id") hoặc ghi đè quán cùng id;
+    # trả về (id, phiên bản dữ liệu mới)
+    conn = connect(path)
+    try:
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            version = _bump_version(conn)
+            cursor = conn.execute(
+                f"INSERT OR REPLACE INTO restaurants ({', '.join(COLUMNS)}, version) VALUES ({', '.join('?' * (len(COLUMNS) + 1))})",
+                _record_to_row(record) + (version,),
+            )
+            return cursor.lastrowid, version
+    finally:
+        conn.close()
+
+
+def main(argv):
+    if len(argv) != 3 or argv[1] not in ("export", "import"):
+        print(__doc__)
+        return 1
+    command, json_path = argv[1], argv[2]
+    if command == "export":
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(load_restaurants(), f, ensure_ascii=False, indent=2)
+    else:
+        with open(json_path, encoding="utf-8") as f:
+            version = save_restaurants(json.load(f))
+        print(f"Đã ghi dữ liệu, phiên bản {version}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
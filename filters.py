@@ -0,0 +1,62 @@
+"""Bộ lọc vector hóa cho DataFrame quán của app5.
+
+Cột dạng list (loại món, bữa ăn) được mã hóa một lần lúc nạp dữ liệu thành các
+cột bool multi-hot (``food_type=Cơm``, ``meals=Trưa``...). Mỗi bộ lọc là một mask
+numpy, kết hợp bằng AND; không có hàm Python nào chạy cho từng dòng.
+"""
+
+import numpy as np
+import pandas as pd
+
+from stats import multi_hot
+
+ALL = "Tất cả"
+LIST_COLUMNS = ("food_type", "meals")
+
+# Lựa chọn -> (thấp, cao, đầu mút được tính) cho Series.between
+DISTANCE_RANGES = {
+    "<500m": (-np.inf, 0.5, "left"),
+    "500m-1km": (0.5, 1, "left"),
+    "1-2km": (1, 2, "both"),
+}
+PRICE_RANGES = {
+    "<30k": (-np.inf, 30, "left"),
+    "30-50k": (30, 50, "both"),
+    ">50k": (50, np.inf, "neither"),
+}
+
+
+def hot_column(column, value):
+    return f"{column}={value}"
+
+
+def encode_list_columns(df, columns=LIST_COLUMNS):
+    """``df`` kèm thêm một cột bool cho mỗi giá trị của các cột list."""
+    parts = [df]
+    for column in columns:
+        matrix, labels = multi_hot(df[column])
+        parts.append(pd.DataFrame(matrix, index=df.index,
+                                  columns=[hot_column(column, label) for label in labels]))
+    return pd.concat(parts, axis=1)
+
+
+def list_values(df, column):
+    # Các giá trị đã mã hóa của một cột list, VD mọi loại món
+    prefix = hot_column(column, "")
+    return sorted(name[len(prefix):] for name in df.columns if name.startswith(prefix))
+
+
+def filter_mask(df, distance=ALL, price=ALL, food_type=ALL, meal=ALL):
+    """Mask bool các quán thỏa cả bốn bộ lọc (``ALL`` là không lọc)."""
+    mask = np.ones(len(df), dtype=bool)
+    for column, ranges, choice in (("distance", DISTANCE_RANGES, distance),
+                                   ("avg_price", PRICE_RANGES, price)):
+        if choice != ALL:
+            low, high, inclusive = ranges[choice]
+            mask &= df[column].between(low, high, inclusive=inclusive).to_numpy()
+    for column, value in (("food_type", food_type), ("meals", meal)):
+        if value != ALL:
+            name = hot_column(column, value)
+            # Giá trị không có quán nào thì không có cột
+            mask &= df[name].to_numpy() if name in df else False
+    return mask
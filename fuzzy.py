@@ -0,0 +1,184 @@
+"""Tìm món/quán chấp nhận gõ sai ("banh my", "tokboki", "bun cha").
+
+Dùng chỉ mục xóa ký tự kiểu SymSpell: mỗi từ trong từ vựng được lưu kèm mọi
+biến thể khi xóa tối đa ``MAX_EDIT_DISTANCE`` ký tự. Một từ gõ sai chỉ cần tra
+các biến thể xóa của chính nó, nên thời gian tra không phụ thuộc kích thước từ
+vựng, rồi mới kiểm tra lại bằng khoảng cách sửa (Damerau-Levenshtein).
+"""
+
+import copy
+from collections import namedtuple
+from itertools import combinations
+
+from text_search import tokenize
+
+MAX_EDIT_DISTANCE = 2
+
+# kind: "dish" hoặc "restaurant"; positions: vị trí các quán có món/tên này
+Match = namedtuple("Match", ["kind", "text", "positions", "score"])
+
+
+def max_distance_for(word):
+    # Từ ngắn chỉ cho sai 1 ký tự, tránh "ga" khớp với mọi từ hai chữ
+    return 1 if len(word) <= 4 else MAX_EDIT_DISTANCE
+
+
+def deletes(word, max_distance):
+    variants = {word}
+    for n in range(1, min(max_distance, len(word)) + 1):
+        for removed in combinations(range(len(word)), n):
+            variants.add("".join(ch for i, ch in enumerate(word) if i not in removed))
+    return variants
+
+
+def edit_distance(a, b, max_distance):
+    """Khoảng cách Damerau-Levenshtein (hoán vị liền kề), dừng sớm khi vượt max_distance."""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class SymSpell:
+    def __init__(self, vocabulary, max_distance=MAX_EDIT_DISTANCE):
+        self.max_distance = max_distance
+        self.words = set(vocabulary)
+        self.index = {}
+        for word in self.words:
+            for variant in deletes(word, max_distance):
+                self.index.setdefault(variant, set()).add(word)
+
+    def with_words(self, vocabulary):
+        """Bản mới có thêm các từ trong ``vocabulary``; bản hiện tại không đổi."""
+        new = copy.copy(self)
+        added = set(vocabulary) - self.words
+        new.words = self.words | added
+        new.index = dict(self.index)
+        for word in added:
+            for variant in deletes(word, self.max_distance):
+                new.index[variant] = new.index.get(variant, set()) | {word}
+        return new
+
+    def lookup(self, word):
+        """Các (từ trong từ vựng, khoảng cách) gần với `word`, gần nhất trước."""
+        max_distance = min(max_distance_for(word), self.max_distance)
+        candidates = set()
+        for variant in deletes(word, max_distance):
+            candidates |= self.index.get(variant, set())
+
+        found = []
+        for candidate in candidates:
+            distance = edit_distance(word, candidate, max_distance)
+            if distance <= max_distance:
+                found.append((candidate, distance))
+        found.sort(key=lambda item: (item[1], item[0]))
+        return found
+
+
+class FuzzyIndex:
+    """Từ vựng tên món và tên quán (đã bỏ dấu) cùng chỉ mục SymSpell trên từng từ."""
+
+    def __init__(self, restaurants):
+        # Mỗi mục là một tên món hoặc tên quán khác nhau (sau khi bỏ dấu)
+        self.entries = []
+        self.entry_ids = {}
+        # Các mục của từng quán, để cập nhật khi một quán thay đổi
+        self.entries_by_pos = []
+        for pos, restaurant in enumerate(restaurants):
+            ids = self._entries_for(restaurant)
+            self.entries_by_pos.append(ids)
+            for entry_id in ids:
+                self.entries[entry_id][3].append(pos)
+
+        self.word_entries = {}
+        for entry_id, (_, _, tokens, _) in enumerate(self.entries):
+            for token in set(tokens):
+                self.word_entries.setdefault(token, []).append(entry_id)
+        self.speller = SymSpell(self.word_entries)
+
+    def _entries_for(self, restaurant):
+        # id các mục (tạo mục mới nếu chưa có) ứng với tên quán và tên món của quán
+        names = [("restaurant", restaurant.get("name", ""))]
+        names += [("dish", item.get("dish", "")) for item in restaurant.get("menu", [])]
+        ids = []
+        for kind, text in names:
+            tokens = tuple(tokenize(text))
+            if not tokens:
+                continue
+            key = (kind, tokens)
+            if key not in self.entry_ids:
+                self.entry_ids[key] = len(self.entries)
+                self.entries.append((kind, text, tokens, []))
+            if self.entry_ids[key] not in ids:
+                ids.append(self.entry_ids[key])
+        return ids
+
+    def updated(self, restaurants, changed):
+        """Bản mới sau khi các quán ở vị trí ``changed`` được thêm/sửa."""
+        new = copy.copy(self)
+        new.entries = list(self.entries)
+        new.entry_ids = dict(self.entry_ids)
+        new.entries_by_pos = self.entries_by_pos + [[] for _ in range(len(restaurants) - len(self.entries_by_pos))]
+        changed = set(changed)
+        touched = set()
+        for pos in changed:
+            touched.update(new.entries_by_pos[pos])
+            new.entries_by_pos[pos] = new._entries_for(restaurants[pos])
+            touched.update(new.entries_by_pos[pos])
+
+        # Tính lại danh sách quán của các mục liên quan (mục mới có id >= số mục cũ)
+        new.word_entries = dict(self.word_entries)
+        new_words = []
+        for entry_id in sorted(touched):
+            kind, text, tokens, positions = new.entries[entry_id]
+            positions = sorted({pos for pos in positions if pos not in changed}
+                               | {pos for pos in changed if entry_id in new.entries_by_pos[pos]})
+            new.entries[entry_id] = (kind, text, tokens, positions)
+            if entry_id >= len(self.entries):
+                for token in set(tokens):
+                    if token not in new.word_entries:
+                        new_words.append(token)
+                    new.word_entries[token] = new.word_entries.get(token, []) + [entry_id]
+        new.speller = self.speller.with_words(new_words) if new_words else self.speller
+        return new
+
+    def match(self, query, limit=10, kind=None):
+        """Các món/quán gần giống truy vấn nhất, điểm từ 0 đến 1."""
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
+
+        # entry_id -> {chỉ số từ trong truy vấn: độ giống tốt nhất}
+        similarity = {}
+        for i, token in enumerate(query_tokens):
+            for word, distance in self.speller.lookup(token):
+                sim = 1 - distance / max(len(token), len(word))
+                for entry_id in self.word_entries[word]:
+                    best = similarity.setdefault(entry_id, {})
+                    if sim > best.get(i, 0.0):
+                        best[i] = sim
+
+        matches = []
+        for entry_id, best in similarity.items():
+            entry_kind, text, tokens, positions = self.entries[entry_id]
+            if (kind is not None and entry_kind != kind) or not positions:
+                # Mục không còn quán nào (quán đã đổi tên/món) thì bỏ qua
+                continue
+            score = sum(best.values()) / len(query_tokens)
+            # Tên dài hơn truy vấn nhiều thì khớp kém cụ thể hơn
+            score *= (len(query_tokens) / max(len(query_tokens), len(tokens))) ** 0.5
+            matches.append(Match(entry_kind, text, positions, round(score, 4)))
+
+        matches.sort(key=lambda m: (-m.score, len(m.text), m.text))
+        return matches[:limit]
@@ -0,0 +1,116 @@
+"""Tìm quán theo tọa độ: k quán gần nhất và các quán trong bán kính R mét.
+
+Tọa độ được chia vào lưới ô vuông (cạnh ``CELL_M`` mét); mỗi truy vấn chỉ tính
+khoảng cách haversine (bằng NumPy) cho các quán trong những ô phủ vùng cần tìm.
+
+Kho dữ liệu của app chính chưa có tọa độ (cột lat/lng đều trống), nên trang chi
+tiết của app chính chưa có mục "Quán lân cận"; mục này chỉ có ở app5, nơi dữ liệu
+mẫu có tọa độ. Khi kho có tọa độ, ``Catalogue.geo`` đã sẵn để tra.
+"""
+
+import copy
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371000
+METERS_PER_DEGREE = 111320
+
+# Cổng trường Đại học Ngoại thương, 91 Chùa Láng (gần đúng)
+CHUA_LANG = (21.0230, 105.8052)
+
+
+def haversine_m(lat, lng, lats, lngs):
+    """Khoảng cách (mét) từ một điểm tới mảng các điểm."""
+    lat1, lng1 = np.radians(lat), np.radians(lng)
+    lat2, lng2 = np.radians(lats), np.radians(lngs)
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+class GeoIndex:
+    CELL_M = 250
+
+    def __init__(self, lats, lngs):
+        self.lats = np.asarray(lats, dtype=float)
+        self.lngs = np.asarray(lngs, dtype=float)
+        known = np.flatnonzero(~(np.isnan(self.lats) | np.isnan(self.lngs)))
+        self.count = len(known)
+
+        # Ô lưới tính theo độ; theo kinh độ thì co lại theo vĩ độ trung bình
+        mean_lat = self.lats[known].mean() if self.count else 0.0
+        self.cell_lat = self.CELL_M / METERS_PER_DEGREE
+        self.cell_lng = self.cell_lat / max(np.cos(np.radians(mean_lat)), 0.01)
+
+        cells = {}
+        rows = np.floor(self.lats[known] / self.cell_lat).astype(np.int64)
+        cols = np.floor(self.lngs[known] / self.cell_lng).astype(np.int64)
+        for pos, row, col in zip(known.tolist(), rows.tolist(), cols.tolist()):
+            cells.setdefault((row, col), []).append(pos)
+        self.cells = {key: np.array(group, dtype=np.int64) for key, group in cells.items()}
+
+    def _cell(self, lat, lng):
+        return int(np.floor(lat / self.cell_lat)), int(np.floor(lng / self.cell_lng))
+
+    def updated(self, lats, lngs, changed):
+        """Bản mới với tọa độ mới của các quán ở vị trí ``changed`` (giữ nguyên kích thước ô)."""
+        new = copy.copy(self)
+        new.lats = np.asarray(lats, dtype=float)
+        new.lngs = np.asarray(lngs, dtype=float)
+        new.count = int(np.count_nonzero(~(np.isnan(new.lats) | np.isnan(new.lngs))))
+        new.cells = dict(self.cells)
+        for pos in sorted(changed):
+            # Bỏ quán khỏi ô cũ rồi thêm vào ô theo tọa độ mới
+            if pos < len(self.lats) and not np.isnan(self.lats[pos]) and not np.isnan(self.lngs[pos]):
+                key = self._cell(self.lats[pos], self.lngs[pos])
+                group = new.cells[key][new.cells[key] != pos]
+                if len(group):
+                    new.cells[key] = group
+                else:
+                    del new.cells[key]
+            if not np.isnan(new.lats[pos]) and not np.isnan(new.lngs[pos]):
+                key = self._cell(new.lats[pos], new.lngs[pos])
+                group = new.cells.get(key, np.empty(0, dtype=np.int64))
+                new.cells[key] = np.sort(np.append(group, pos))
+        return new
+
+    def _candidates(self, lat, lng, radius_m):
+        rows = int(np.ceil(radius_m / self.CELL_M))
+        row, col = self._cell(lat, lng)
+        if (2 * rows + 1) ** 2 > len(self.cells):
+            # Vùng tìm phủ nhiều ô hơn số ô có quán: duyệt thẳng các ô có quán
+            groups = [group for (r, c), group in self.cells.items()
+                      if abs(r - row) <= rows and abs(c - col) <= rows]
+        else:
+            groups = [self.cells[(r, c)]
+                      for r in range(row - rows, row + rows + 1)
+                      for c in range(col - rows, col + rows + 1)
+                      if (r, c) in self.cells]
+        if not groups:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(groups)
+
+    def within(self, lat, lng, radius_m):
+        """(vị trí, khoảng cách mét) các quán trong bán kính, gần trước."""
+        candidates = self._candidates(lat, lng, radius_m)
+        distances = haversine_m(lat, lng, self.lats[candidates], self.lngs[candidates])
+        inside = distances <= radius_m
+        candidates, distances = candidates[inside], distances[inside]
+        order = np.argsort(distances, kind="stable")
+        return candidates[order], distances[order]
+
+    def nearest(self, lat, lng, k=5, exclude=None):
+        """(vị trí, khoảng cách mét) của k quán gần nhất, gần trước."""
+        want = k + (1 if exclude is not None else 0)
+        want = min(want, self.count)
+        radius = self.CELL_M
+        while True:
+            positions, distances = self.within(lat, lng, radius)
+            # Đủ k quán trong bán kính hiện tại thì không còn quán nào gần hơn ở ngoài
+            if len(positions) >= want or radius > EARTH_RADIUS_M * np.pi:
+                break
+            radius *= 2
+        if exclude is not None:
+            keep = positions != exclude
+            positions, distances = positions[keep], distances[keep]
+        return positions[:k], distances[:k]
@@ -0,0 +1,302 @@
+"""Kiểm duyệt đóng góp: phát hiện quán trùng rồi thêm/gộp vào kho dữ liệu.
+
+Mỗi đóng góp đang chờ được so với các quán trong kho và các đóng góp chờ duyệt
+trước nó. Để không phải so từng cặp, quán được chia khối (blocking) theo:
+
+- đường + ngõ ("chua lang|ngo 84"), hoặc đường + số nhà nếu không ở trong ngõ
+- từng từ trong tên quán (bỏ qua từ quá phổ biến như "bun", "com")
+
+và chỉ được so với các quán chung khối. Điểm giống nhau kết hợp tên (đã bỏ dấu)
+và địa chỉ (đường, ngõ/ngách, số nhà).
+
+Dùng từ dòng lệnh:
+
+    python moderation.py queue
+    python moderation.py approve <id đóng góp>
+    python moderation.py merge <id đóng góp> <id quán>
+    python moderation.py reject <id đóng góp>
+"""
+
+import re
+import sys
+from collections import namedtuple
+from difflib import SequenceMatcher
+
+import contributions
+import data_store
+from text_search import fold, tokenize
+
+# Ngưỡng điểm (0..1): trên DUPLICATE_SCORE gần như chắc chắn là cùng một quán,
+# trên MERGE_SCORE là ứng viên nên xem xét gộp
+DUPLICATE_SCORE = 0.85
+MERGE_SCORE = 0.6
+# Cùng địa chỉ mà tên khác hẳn là hai quán khác nhau (nhiều quán chung một số nhà)
+MIN_NAME_SIMILARITY = 0.5
+NAME_WEIGHT = 0.6
+ADDRESS_WEIGHT = 0.4
+# Khối theo từ trong tên lớn hơn mức này thì bỏ qua (từ quá phổ biến)
+MAX_NAME_BLOCK = 30
+
+# Loại món trong form đóng góp (app chính và app5) -> nhãn loại món của danh mục;
+# loại không có nhãn tương ứng được giữ nguyên
+TYPE_TAGS = {
+    "Cơm": "Cơm/Xôi/Cháo",
+    "Xôi": "Cơm/Xôi/Cháo",
+    "Bún": "Bún/Phở/Miến/Bánh canh/Súp",
+    "Phở": "Bún/Phở/Miến/Bánh canh/Súp",
+    "Mì": "Bún/Phở/Miến/Bánh canh/Súp",
+    "Bánh mì": "Bánh mì pate/chảo/muối ớt",
+}
+
+# Cấp ngõ: ngõ/hẻm/kiệt chứa ngách
+ALLEY_LEVELS = {"ngo": 0, "hem": 0, "kiet": 0, "ngach": 1}
+ADDRESS_STOPWORDS = {"so", "nha", "pho", "duong"}
+_ADDRESS_TOKEN_RE = re.compile(r"\d+[a-z]?(?:/\d+[a-z]?)*|[a-z]+")
+
+Address = namedtuple("Address", ["street", "alleys", "number"])
+# kind: "restaurant" hoặc "contribution"; flag: "duplicate" hoặc "merge"
+Candidate = namedtuple("Candidate", ["kind", "id", "name", "address", "score", "flag"])
+
+
+def parse_address(text):
+    """ "Số 6A Ngách 2 Ngõ 121 Chùa Láng" -> Address("chua lang", ("ngo 121", "ngach 2"), "6a")."""
+    text = re.sub(r"\(.*?\)", " ", fold(text))
+    number, alleys, street = "", [], ""
+    # Các phần sau dấu phẩy là phường/quận/thành phố: chỉ đọc tới phần có tên đường
+    for segment in re.split(r"[,;–-]", text):
+        tokens = _ADDRESS_TOKEN_RE.findall(segment)
+        street_words = []
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if token in ALLEY_LEVELS and i + 1 < len(tokens) and tokens[i + 1][0].isdigit():
+                # "ngõ 121/2" là ngách 2 của ngõ 121
+                first, *rest = tokens[i + 1].split("/")
+                alleys.append(f"{token} {first}")
+                alleys.extend(f"ngach {part}" for part in rest)
+                i += 2
+                continue
+            if token[0].isdigit():
+                if not number and not alleys and not street_words:
+                    number = token
+            elif token not in ADDRESS_STOPWORDS:
+                street_words.append(token)
+            i += 1
+        if street_words:
+            street = " ".join(street_words)
+            break
+    alleys.sort(key=lambda alley: ALLEY_LEVELS[alley.split()[0]])
+    return Address(street, tuple(alleys), number)
+
+
+def address_keys(address):
+    if not address.street:
+        return []
+    if address.alleys:
+        return [f"{address.street}|{address.alleys[0]}"]
+    if address.number:
+        return [f"{address.street}|#{address.number}"]
+    return [address.street]
+
+
+def address_similarity(a, b):
+    if not a.street or a.street != b.street:
+        return 0.0
+    if a.alleys != b.alleys:
+        shorter, longer = sorted((a.alleys, b.alleys), key=len)
+        # Cùng ngõ nhưng một bên ghi thêm ngách
+        return 0.3 if longer[:len(shorter)] == shorter and shorter else 0.1
+    if a.number and b.number and a.number != b.number:
+        return 0.5
+    return 1.0
+
+
+def name_similarity(a, b):
+    if not a or not b:
+        return 0.0
+    ratio = SequenceMatcher(None, a, b).ratio()
+    # Tên này nằm trọn trong tên kia ("Chà bá lửa" / "Xôi Sùng sục - Chà Bá lửa")
+    overlap = len(set(a) & set(b)) / min(len(set(a)), len(set(b)))
+    return max(ratio, 0.9 * overlap)
+
+
+class DuplicateIndex:
+    """Chỉ mục chia khối; thêm dần từng quán/đóng góp, mỗi lần tra chỉ so trong khối."""
+
+    def __init__(self):
+        # (kind, id, tên, địa chỉ, từ trong tên, địa chỉ đã phân tích)
+        self.entries = []
+        self.blocks = {}
+
+    def add(self, kind, entry_id, name, address):
+        name_words = tuple(tokenize(name))
+        parsed = parse_address(address)
+        pos = len(self.entries)
+        self.entries.append((kind, entry_id, name, address, name_words, parsed))
+        for key in self._keys(name_words, parsed):
+            self.blocks.setdefault(key, []).append(pos)
+
+    def _keys(self, name_words, parsed):
+        keys = [("address", key) for key in address_keys(parsed)]
+        keys += [("name", word) for word in set(name_words) if len(word) > 2]
+        return keys
+
+    def candidates(self, name, address, limit=5):
+        """Các quán/đóng góp có thể trùng, điểm cao trước."""
+        name_words = tuple(tokenize(name))
+        parsed = parse_address(address)
+        positions = set()
+        for key in self._keys(name_words, parsed):
+            block = self.blocks.get(key, [])
+            if key[0] == "name" and len(block) > MAX_NAME_BLOCK:
+                continue
+            positions.update(block)
+
+        found = []
+        for pos in positions:
+            kind, entry_id, entry_name, entry_address, entry_words, entry_parsed = self.entries[pos]
+            name_score = name_similarity(name_words, entry_words)
+            if name_score < MIN_NAME_SIMILARITY:
+                continue
+            score = NAME_WEIGHT * name_score + ADDRESS_WEIGHT * address_similarity(parsed, entry_parsed)
+            if score >= MERGE_SCORE:
+                flag = "duplicate" if score >= DUPLICATE_SCORE else "merge"
+                found.append(Candidate(kind, entry_id, entry_name, entry_address, round(score, 3), flag))
+        found.sort(key=lambda c: (-c.score, c.kind, c.id))
+        return found[:limit]
+
+
+def build_queue(restaurants, pending):
+    """[(đóng góp, ứng viên trùng)] theo thứ tự gửi.
+
+    Mỗi đóng góp được so với kho dữ liệu và với các đóng góp chờ duyệt trước nó.
+    """
+    index = DuplicateIndex()
+    for restaurant in restaurants:
+        index.add("restaurant", restaurant["id"], restaurant["name"], restaurant["address"])
+    queue = []
+    for contribution in pending:
+        queue.append((contribution, index.candidates(contribution["name"], contribution["address"])))
+        index.add("contribution", contribution["id"], contribution["name"], contribution["address"])
+    return queue
+
+
+def _review(contribution):
+    # contribution_id đánh dấu review đã được ghi vào kho, để duyệt lại một đóng
+    # góp bị lỗi giữa chừng không thêm quán/review lần thứ hai
+    payload = contribution["payload"]
+    return {"name": "Sinh viên đóng góp", "rating": payload.get("rating", 0),
+            "content": payload.get("review", ""), "contribution_id": contribution["id"]}
+
+
+def catalogue_types(types):
+    """Loại món của form -> nhãn loại món của danh mục, bỏ nhãn trùng."""
+    tags = []
+    for value in types:
+        tag = TYPE_TAGS.get(value, value)
+        if tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def to_restaurant(contribution):
+    """Bản ghi quán mới từ một đóng góp (form của app chính hoặc app5)."""
+    payload = contribution["payload"]
+    if "distance" in payload:
+        distance = f"{round(payload['distance'] * 1000)}m"
+    else:
+        distance = ""
+    return {
+        "name": contribution["name"],
+        "address": contribution["address"],
+        "distance": distance,
+        "price": payload.get("price", payload.get("price_range", "")),
+        "type": catalogue_types(payload.get("type", payload.get("food_type", []))),
+        "time": payload.get("time", payload.get("meals", [])),
+        "hours": "",
+        "menu": [],
+        "reviews": [_review(contribution)],
+    }
+
+
+# Kho quán và kho đóng góp là hai file SQLite nên không ghi chung một transaction
+# được: quán/review được ghi trước, rồi mới đổi trạng thái đóng góp. Nếu bước sau
+# lỗi, đóng góp vẫn "pending"; duyệt lại sẽ thấy review đã có trong kho (theo
+# contribution_id) và chỉ đổi trạng thái, không ghi thêm lần nữa.
+
+def approve(contribution_id, restaurants_path=data_store.DB_PATH, contributions_path=contributions.DB_PATH):
+    """Thêm đóng góp thành quán mới; trả về (id quán, phiên bản dữ liệu mới)."""
+    contribution = _pending(contribution_id, contributions_path)
+    restaurant_id = data_store.find_contribution(contribution_id, restaurants_path)
+    if restaurant_id is None:
+        restaurant_id, version = data_store.save_restaurant(to_restaurant(contribution), restaurants_path)
+    else:
+        version = data_store.data_version(restaurants_path)
+    contributions.set_status(contribution_id, "approved", restaurant_id, contributions_path)
+    return restaurant_id, version
+
+
+def merge(contribution_id, restaurant_id, restaurants_path=data_store.DB_PATH,
+          contributions_path=contributions.DB_PATH):
+    """Gộp review của đóng góp vào quán có sẵn; trả về phiên bản dữ liệu mới."""
+    contribution = _pending(contribution_id, contributions_path)
+    applied_to = data_store.find_contribution(contribution_id, restaurants_path)
+    if applied_to is None:
+        restaurant = data_store.load_restaurant(restaurant_id, restaurants_path)
+        if restaurant is None:
+            raise ValueError(f"Không có quán {restaurant_id}")
+        restaurant["reviews"].append(_review(contribution))
+        _, version = data_store.save_restaurant(restaurant, restaurants_path)
+    elif applied_to == restaurant_id:
+        version = data_store.data_version(restaurants_path)
+    else:
+        raise ValueError(f"Đóng góp {contribution_id} đã được ghi vào quán {applied_to}")
+    contributions.set_status(contribution_id, "merged", restaurant_id, contributions_path)
+    return version
+
+
+def reject(contribution_id, contributions_path=contributions.DB_PATH):
+    _pending(contribution_id, contributions_path)
+    contributions.set_status(contribution_id, "rejected", path=contributions_path)
+
+
+def _pending(contribution_id, contributions_path=contributions.DB_PATH):
+    contribution = contributions.load_contribution(contribution_id, contributions_path)
+    if contribution is None or contribution["status"] != "pending":
+        raise ValueError(f"Không có đóng góp {contribution_id} đang chờ duyệt")
+    return contribution
+
+
+def main(argv):
+    command = argv[1] if len(argv) > 1 else ""
+    args = [int(arg) for arg in argv[2:] if arg.isdigit()]
+    if command == "queue" and not args:
+        queue = build_queue(data_store.load_restaurants(), contributions.load_contributions("pending"))
+        for contribution, candidates in queue:
+            print(f"#{contribution['id']} {contribution['name']} - {contribution['address']}")
+            for c in candidates:
+                label = "TRÙNG" if c.flag == "duplicate" else "nên gộp?"
+                print(f"    {label} {c.score:.2f} {c.kind} {c.id}: {c.name} - {c.address}")
+        print(f"{len(queue)} đóng góp đang chờ duyệt")
+    elif command in ("approve", "merge", "reject") and len(args) == (2 if command == "merge" else 1):
+        try:
+            if command == "approve":
+                restaurant_id, version = approve(args[0])
+                print(f"Đã thêm quán {restaurant_id}, phiên bản dữ liệu {version}")
+            elif command == "merge":
+                version = merge(*args)
+                print(f"Đã gộp vào quán {args[1]}, phiên bản dữ liệu {version}")
+            else:
+                reject(args[0])
+                print(f"Đã từ chối đóng góp {args[0]}")
+        except ValueError as exc:
+            print(exc)
+            return 1
+    else:
+        print(__doc__)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
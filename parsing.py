@@ -0,0 +1,170 @@
+"""Chuyển các trường dạng chữ tự do của quán ăn thành số để lọc/sắp xếp."""
+
+import re
+from collections import namedtuple
+
+# "Cạnh cổng trường FTU", "Gần ngõ 84"... coi như trong vòng 100m
+NEAR_WORDS = ("cạnh", "gần", "đối diện", "trong")
+NEAR_DISTANCE_M = 100
+
+_NUMBER = r"(\d+(?:[.,]\d+)?)"
+_DISTANCE_RE = re.compile(
+    rf"^\s*([<>]=?)?\s*{_NUMBER}\s*(km|m)?\s*(?:-\s*{_NUMBER}\s*(km|m)?)?\s*$",
+    re.IGNORECASE,
+)
+
+
+def _to_meters(number, unit):
+    value = float(number.replace(",", "."))
+    if unit and unit.lower() == "km":
+        value *= 1000
+    return int(round(value))
+
+
+def parse_distance(text):
+    """Trả về (min_m, max_m) từ chuỗi khoảng cách, hoặc None nếu không đọc được.
+
+    "350m" -> (350, 350), "1.3km" -> (1300, 1300), "200-300m" -> (200, 300),
+    "<500m" -> (0, 500), "Cạnh cổng trường FTU" -> (0, 100)
+    """
+    text = (text or "").strip()
+    if not text:
+        return None
+
+    match = _DISTANCE_RE.match(text)
+    if match is None:
+        if text.lower().startswith(NEAR_WORDS):
+            return (0, NEAR_DISTANCE_M)
+        return None
+
+    op, first, first_unit, second, second_unit = match.groups()
+    # "200-300m": đơn vị của số sau áp dụng cho cả số trước
+    first_unit = first_unit or second_unit or "m"
+    low = _to_meters(first, first_unit)
+
+    if second is not None:
+        high = _to_meters(second, second_unit or first_unit)
+        return (min(low, high), max(low, high))
+    if op and op.startswith("<"):
+        return (0, low)
+    return (low, low)
+
+
+# Giá món: số có thể có "k" (nghìn đồng) hoặc "đ"/"vnd", phần sau "/" là đơn vị
+# tính. Số có nhóm ba chữ số ngăn bởi "." hoặc "," ("35.000", "1.500.000") là
+# số nguyên ghi theo hàng nghìn, không phải số thập phân
+_PRICE_NUMBER = r"(\d{1,3}(?:[.,]\d{3})+(?!\d)|\d+(?:[.,]\d+)?)\s*(k\b|đ|vn[dđ]\b)?"
+# "25-30k": đơn vị của số sau áp dụng cho cả số trước
+_PRICE_RANGE_RE = re.compile(rf"{_PRICE_NUMBER}(?:\s*-\s*{_PRICE_NUMBER})?", re.IGNORECASE)
+_THOUSANDS_RE = re.compile(r"^\d{1,3}(?:[.,]\d{3})+$")
+# "<30k", "dưới 30k", ">50k", "trên 50k": khoảng giá hở một đầu
+_PRICE_BOUND_RE = re.compile(r"^\s*(<=?|>=?|dưới|trên)", re.IGNORECASE)
+
+
+# Giá đã đọc, tính bằng nghìn đồng; unit là đơn vị tính nếu có ("xiên", "lon"...)
+Price = namedtuple("Price", ["min_k", "max_k", "unit"])
+
+
+def _price_value(number, suffix):
+    # (giá nghìn đồng, có ghi rõ là tiền hay không)
+    if _THOUSANDS_RE.match(number):
+        value = float(number.replace(".", "").replace(",", ""))
+    else:
+        value = float(number.replace(",", "."))
+    if suffix.lower() == "k":
+        return value, True
+    # Số không kèm "k" mà >= 1000 hoặc kèm "đ" là giá ghi bằng đồng (VD "35000", "35.000đ")
+    if value >= 1000 or suffix:
+        return value / 1000, True
+    return value, False
+
+
+def parse_price(text):
+    """Đọc chuỗi giá món thành Price, hoặc None nếu không có số nào.
+
+    "35k" -> (35, 35, ""), "10k/xiên" -> (10, 10, "xiên"),
+    "25k-30k" -> (25, 30, ""), "18k (S)" -> (18, 18, ""),
+    "179k (nửa con) - 358k (nguyên con)" -> (179, 358, ""),
+    "35.000đ" -> (35, 35, ""), "Combo 2 người 199k" -> (199, 199, ""),
+    "<30k" -> (0, 30, ""), "trên 50k" -> (50, inf, "")
+    """
+    text = (text or "").strip()
+    amount, _, unit = text.partition("/")
+
+    values = []
+    for first, first_suffix, second, second_suffix in _PRICE_RANGE_RE.findall(amount):
+        values.append(_price_value(first, first_suffix or second_suffix))
+        if second:
+            values.append(_price_value(second, second_suffix))
+    if not values:
+        return None
+    # Có số ghi rõ là tiền thì bỏ các số trơn khác (số người, số món, cỡ...)
+    if any(marked for _, marked in values):
+        values = [(value, marked) for value, marked in values if marked]
+    values = [value for value, _ in values]
+    bound = _PRICE_BOUND_RE.match(amount)
+    if bound and len(values) == 1:
+        if bound.group(1).lower() in ("<", "<=", "dưới"):
+            return Price(0.0, values[0], unit.strip())
+        return Price(values[0], float("inf"), unit.strip())
+    return Price(min(values), max(values), unit.strip())
+
+
+# Giờ mở cửa: các khoảng "HH:MM - HH:MM" cách nhau bởi "," hoặc "/"
+MINUTES_PER_DAY = 24 * 60
+ALL_DAY_WORDS = ("cả ngày", "suốt ngày")
+# "24/24", "24h" chỉ tính là mở cả ngày khi đứng riêng, không phải giờ trong "17h-24h"
+ALL_DAY_TOKENS = ("24/24", "24/7", "24h")
+# "Mở đến 22:00" không ghi giờ mở, coi như mở từ 6:00 sáng
+DEFAULT_OPENING_MINUTE = 6 * 60
+
+_CLOCK = r"(\d{1,2})[:h](\d{2})?"
+_HOURS_RANGE_RE = re.compile(rf"{_CLOCK}\s*-\s*{_CLOCK}")
+_OPEN_UNTIL_RE = re.compile(rf"đến\s*{_CLOCK}", re.IGNORECASE)
+_ALL_DAY_RE = re.compile(
+    "|".join([re.escape(word) for word in ALL_DAY_WORDS]
+             + [rf"(?<![\w/:]){re.escape(token)}(?![\w/:])" for token in ALL_DAY_TOKENS]),
+    re.IGNORECASE,
+)
+
+
+def _to_minute(hour, minute):
+    return min(int(hour) * 60 + int(minute or 0), MINUTES_PER_DAY)
+
+
+def _add_interval(intervals, start, end):
+    # Khoảng qua nửa đêm ("5:00 - 0:00", "18:00 - 2:00") được tách làm hai
+    if end <= start:
+        intervals.append((start, MINUTES_PER_DAY))
+        if end > 0:
+            intervals.append((0, end))
+    else:
+        intervals.append((start, end))
+
+
+def parse_hours(text):
+    """Đọc giờ mở cửa thành danh sách khoảng [bắt đầu, kết thúc) tính theo phút trong ngày.
+
+    "10:00 - 14:00, 17:00 - 22:00" -> [(600, 840), (1020, 1320)],
+    "5:00 - 0:00" -> [(300, 1440)], "17h-24h" -> [(1020, 1440)],
+    "Mở đến 22:00" -> [(360, 1320)], "Mở cả ngày" -> [(0, 1440)].
+    Trả về None nếu không có thông tin.
+    """
+    text = (text or "").strip()
+    if not text:
+        return None
+
+    # Khoảng giờ ghi rõ được ưu tiên; chỉ khi không có mới xét "Mở đến ..." rồi "cả ngày"
+    intervals = []
+    for start_h, start_m, end_h, end_m in _HOURS_RANGE_RE.findall(text):
+        _add_interval(intervals, _to_minute(start_h, start_m), _to_minute(end_h, end_m))
+    if intervals:
+        return intervals
+
+    match = _OPEN_UNTIL_RE.search(text)
+    if match is not None:
+        _add_interval(intervals, DEFAULT_OPENING_MINUTE, _to_minute(*match.groups()))
+        return intervals
+    if _ALL_DAY_RE.search(text):
+        return [(0, MINUTES_PER_DAY)]
+    return None
@@ -0,0 +1,176 @@
+"""Gợi ý "Hôm nay ăn gì?": chấm điểm mọi quán trong danh mục theo ngữ cảnh hiện tại.
+
+Điểm của một quán là tổng có trọng số các thành phần trong khoảng 0..1:
+
+- khoảng cách tới Chùa Láng (càng gần càng cao)
+- giá trung vị so với ngân sách
+- điểm đánh giá Bayes (``RatingStats.bayes``)
+- đang mở cửa (quán chắc chắn đang đóng bị loại, quán chưa rõ giờ được nửa điểm)
+- có phục vụ bữa hiện tại (sáng/trưa/chiều/tối/khuya) hay không
+
+Điểm được tính bằng numpy cho cả danh mục một lần cho mỗi khung thời gian và
+ngân sách; chỉ mask quán đang mở được tính lại theo đúng phút của mỗi lần gọi
+(một dòng bitmap của ``OpeningHours``), nên quán vừa đóng cửa không còn được gợi
+ý. Top-k dùng ``argpartition`` (không sắp cả danh mục), còn "chọn giúp tôi" bốc
+ngẫu nhiên theo trọng số bằng bảng alias nên mỗi lần bốc là O(1).
+"""
+
+import random
+
+import numpy as np
+
+from parsing import MINUTES_PER_DAY
+
+WEIGHTS = {
+    "distance": 0.25,
+    "price": 0.2,
+    "rating": 0.3,
+    "open": 0.1,
+    "slot": 0.15,
+}
+# Điểm khoảng cách giảm còn 1/e ở mỗi DISTANCE_SCALE mét
+DISTANCE_SCALE = 800
+# Ngân sách mặc định cho một bữa (nghìn đồng)
+DEFAULT_BUDGET = 40
+# Điểm cho thành phần không có dữ liệu (chưa rõ khoảng cách, giá, giờ mở cửa)
+UNKNOWN_SCORE = 0.5
+# Trọng số bốc ngẫu nhiên là điểm mũ SURPRISE_POWER: quán điểm cao được bốc nhiều
+# hơn hẳn, nhưng quán nào đủ điều kiện cũng có cơ hội
+SURPRISE_POWER = 4
+# Số lần bốc lại khi quán bốc được đang đóng cửa, trước khi bốc thẳng trong các
+# quán đang mở (khi rất ít quán mở)
+SURPRISE_TRIES = 32
+
+# Bữa theo giờ: (phút bắt đầu, tên khung giờ như trong trường "time" của quán)
+MEAL_SLOTS = [
+    (5 * 60, "Sáng"),
+    (10 * 60, "Trưa"),
+    (14 * 60, "Chiều"),
+    (17 * 60, "Tối"),
+    (21 * 60, "Khuya"),
+]
+
+
+def meal_slot(minute):
+    """Khung giờ của phút thứ ``minute`` trong ngày, VD 12:30 -> "Trưa"."""
+    minute %= MINUTES_PER_DAY
+    slot = MEAL_SLOTS[-1][1]
+    for start, name in MEAL_SLOTS:
+        if minute >= start:
+            slot = name
+    return slot
+
+
+def component_scores(catalogue, minute, budget=DEFAULT_BUDGET):
+    """Các thành phần điểm (mảng theo vị trí quán) và mask quán đã rõ giờ mở cửa.
+
+    Quán đang đóng cửa không được gợi ý nên không cần điểm "đang mở": thành phần
+    này chỉ phân biệt quán rõ giờ (1) với quán chưa rõ giờ (``UNKNOWN_SCORE``), và
+    không đổi theo phút. ``minute`` chỉ dùng để chọn bữa hiện tại.
+    """
+    size = len(catalogue)
+
+    meters = np.full(size, np.nan)
+    meters[catalogue.distances.positions] = catalogue.distances.keys
+    distance = np.where(np.isnan(meters), UNKNOWN_SCORE, np.exp(-meters / DISTANCE_SCALE))
+
+    median = catalogue.prices.median
+    over = np.maximum(median - budget, 0) / budget
+    price = np.where(np.isnan(median), UNKNOWN_SCORE, np.clip(1 - over, 0, 1))
+
+    rating = (catalogue.ratings.bayes - 1) / (catalogue.ratings.STARS - 1)
+
+    known = np.array([intervals is not None for intervals in catalogue.hours.intervals], dtype=bool)
+    open_score = np.where(known, 1.0, UNKNOWN_SCORE)
+
+    slot_bits = catalogue.tags.get("time", meal_slot(minute))
+    slot = np.unpackbits(slot_bits, count=size).astype(float)
+
+    components = {"distance": distance, "price": price, "rating": rating, "open": open_score, "slot": slot}
+    return components, known
+
+
+class AliasTable:
+    """Bốc ngẫu nhiên vị trí i với xác suất tỉ lệ ``weights[i]`` (phương pháp alias của Vose).
+
+    Dựng bảng O(n); mỗi lần bốc chỉ cần một số nguyên ngẫu nhiên và một số thực.
+    """
+
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=float)
+        self.size = len(weights)
+        total = weights.sum()
+        if total <= 0:
+            self.size = 0
+            return
+
+        # Vòng lặp dựng bảng chạy trên list Python: nhanh hơn đọc/ghi từng phần tử numpy
+        scaled = weights * (self.size / total)
+        small = np.flatnonzero(scaled < 1).tolist()
+        large = np.flatnonzero(scaled >= 1).tolist()
+        scaled = scaled.tolist()
+        prob = [1.0] * self.size
+        alias = list(range(self.size))
+        while small and large:
+            less, more = small.pop(), large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+        # Phần còn lại giữ xác suất 1 (chỉ lệch do sai số làm tròn)
+        self.prob = prob
+        self.alias = alias
+
+    def sample(self, rng=random):
+        """Một vị trí ngẫu nhiên, hoặc None nếu mọi trọng số đều bằng 0."""
+        if not self.size:
+            return None
+        i = rng.randrange(self.size)
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+class Recommender:
+    """Điểm gợi ý của cả danh mục trong một khung thời gian, dùng chung giữa các session.
+
+    ``minute`` khi dựng chỉ quyết định bữa hiện tại; ``top`` và ``surprise`` nhận
+    phút lúc gọi để loại quán đang đóng cửa.
+    """
+
+    def __init__(self, catalogue, minute, budget=DEFAULT_BUDGET):
+        self.hours = catalogue.hours
+        self.slot = meal_slot(minute)
+        self.components, self.known = component_scores(catalogue, minute, budget)
+        self.scores = sum(WEIGHTS[name] * values for name, values in self.components.items())
+        self.weights = self.scores ** SURPRISE_POWER
+        self.alias = AliasTable(self.weights)
+
+    def eligible(self, minute):
+        """Mask quán được gợi ý ở phút ``minute``: đang mở cửa hoặc chưa rõ giờ."""
+        return self.hours.open_mask(minute) | ~self.known
+
+    def top(self, k, minute):
+        """Vị trí k quán điểm cao nhất trong các quán đủ điều kiện, điểm giảm dần."""
+        candidates = np.flatnonzero(self.eligible(minute))
+        if k < len(candidates):
+            # Chỉ tách k quán tốt nhất, không sắp xếp cả danh mục
+            keep = np.argpartition(-self.scores[candidates], k - 1)[:k]
+            candidates = candidates[keep]
+        order = np.lexsort((candidates, -self.scores[candidates]))
+        return candidates[order]
+
+    def surprise(self, minute, rng=random):
+        """Một quán bốc ngẫu nhiên theo điểm, hoặc None nếu không có quán nào phù hợp."""
+        eligible = self.eligible(minute)
+        # Bốc trên cả danh mục rồi bỏ quán đang đóng: vẫn đúng tỉ lệ theo trọng số
+        # giữa các quán đủ điều kiện, mà không phải dựng lại bảng alias mỗi phút
+        for _ in range(SURPRISE_TRIES):
+            pos = self.alias.sample(rng)
+            if pos is None:
+                return None
+            if eligible[pos]:
+                return int(pos)
+        candidates = np.flatnonzero(eligible)
+        cumulative = np.cumsum(self.weights[candidates])
+        if not len(candidates) or cumulative[-1] <= 0:
+            return None
+        return int(candidates[np.searchsorted(cumulative, rng.random() * cumulative[-1], side="right")])
@@ -0,0 +1,187 @@
+"""Quán tương tự: bảng k quán gần giống nhất của mọi quán, tính sẵn cho mỗi phiên bản dữ liệu.
+
+Mỗi quán là một vector TF-IDF (đã chuẩn hóa) trên các từ trong tên món, loại món
+và review. Độ giống văn bản là cosine, tính bằng chỉ mục ngược nên chỉ các cặp
+quán có chung ít nhất một từ mới được so. Điểm cuối cùng kết hợp thêm độ gần về
+giá (trung vị) và vị trí. Trang chi tiết chỉ tra bảng, không tính gì thêm.
+
+Dựng bảng mất vài giây với danh mục lớn, nên ``SimilarBuilder`` dựng trong một
+thread nền mỗi khi có phiên bản dữ liệu mới; trong lúc đó trang chi tiết chỉ ẩn
+mục "Quán tương tự" chứ không phải chờ.
+"""
+
+import math
+import threading
+from collections import Counter
+
+import numpy as np
+
+from geo import haversine_m
+from text_search import tokenize
+
+# Trọng số theo trường khi đếm từ
+FIELD_WEIGHTS = {
+    "dish": 1.0,
+    "type": 1.5,
+    "review": 0.5,
+}
+TEXT_WEIGHT = 0.7
+PRICE_WEIGHT = 0.15
+DISTANCE_WEIGHT = 0.15
+# Độ gần giảm còn 1/e khi giá lệch PRICE_SCALE nghìn đồng / cách nhau DISTANCE_SCALE mét
+PRICE_SCALE = 15
+DISTANCE_SCALE = 1000
+# Điểm cho đặc trưng không có dữ liệu ở một trong hai quán
+UNKNOWN_SCORE = 0.5
+NEIGHBOURS = 5
+# Từ có trong quá nhiều quán gần như không phân biệt được quán nào, lại làm số cặp
+# phải so tăng theo bình phương: bỏ khỏi vector
+MAX_DF_RATIO = 0.5
+MAX_DF = 1000
+
+
+def restaurant_terms(restaurant):
+    # (trường, đoạn văn bản) dùng để so độ giống của một quán
+    for item in restaurant.get("menu", []):
+        yield "dish", item.get("dish", "")
+    for value in restaurant.get("type", []):
+        yield "type", value
+    for review in restaurant.get("reviews", []):
+        yield "review", review.get("content", "")
+
+
+class SimilarIndex:
+    """``neighbours[i]``: vị trí các quán giống quán i nhất (-1 nếu không đủ), ``scores[i]``: điểm."""
+
+    def __init__(self, catalogue):
+        restaurants = catalogue.restaurants
+        self.size = len(restaurants)
+        counts = [self._counts(r) for r in restaurants]
+
+        df = Counter(token for document in counts for token in document)
+        max_df = min(MAX_DF_RATIO * self.size, MAX_DF)
+        idf = {token: math.log((1 + self.size) / (1 + n)) + 1
+               for token, n in df.items() if n <= max(max_df, 1)}
+
+        # Vector TF-IDF chuẩn hóa của từng quán: {từ: trọng số}
+        vectors = []
+        postings = {}
+        for pos, document in enumerate(counts):
+            vector = {token: (1 + math.log(count)) * idf[token]
+                      for token, count in document.items() if token in idf}
+            norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+            vector = {token: w / norm for token, w in vector.items()}
+            vectors.append(vector)
+            for token, weight in vector.items():
+                # Từ chỉ có ở một quán không tạo ra cặp nào
+                if df[token] > 1:
+                    postings.setdefault(token, ([], []))
+                    postings[token][0].append(pos)
+                    postings[token][1].append(weight)
+        postings = {token: (np.array(positions, dtype=np.int64), np.array(weights))
+                    for token, (positions, weights) in postings.items()}
+
+        median = catalogue.prices.median
+        meters = np.full(self.size, np.nan)
+        meters[catalogue.distances.positions] = catalogue.distances.keys
+        lats, lngs = catalogue.geo.lats, catalogue.geo.lngs
+
+        self.neighbours = np.full((self.size, NEIGHBOURS), -1, dtype=np.int64)
+        self.scores = np.zeros((self.size, NEIGHBOURS))
+        for pos, vector in enumerate(vectors):
+            shared = [(postings[token], weight) for token, weight in vector.items() if token in postings]
+            if not shared:
+                continue
+            # Cosine với mọi quán có chung từ: cộng dồn tích trọng số theo từng từ
+            candidates = np.concatenate([positions for (positions, _), _ in shared])
+            products = np.concatenate([weights * weight for (_, weights), weight in shared])
+            if len(candidates) * 8 > self.size:
+                # Nhiều ứng viên: cộng thẳng vào mảng cỡ cả danh mục, nhanh hơn sắp xếp
+                text = np.bincount(candidates, weights=products, minlength=self.size)
+                candidates = np.flatnonzero(text)
+                text = text[candidates]
+            else:
+                candidates, inverse = np.unique(candidates, return_inverse=True)
+                text = np.bincount(inverse, weights=products)
+            keep = candidates != pos
+            candidates, text = candidates[keep], text[keep]
+            if len(candidates) == 0:
+                continue
+
+            price = np.exp(-np.abs(median[candidates] - median[pos]) / PRICE_SCALE)
+            price = np.where(np.isnan(price), UNKNOWN_SCORE, price)
+            # Khoảng cách giữa hai quán nếu cả hai có tọa độ, không thì so khoảng
+            # cách tới Chùa Láng (kho hiện chưa có tọa độ nên luôn là cách sau)
+            apart = haversine_m(lats[pos], lngs[pos], lats[candidates], lngs[candidates])
+            apart = np.where(np.isnan(apart), np.abs(meters[candidates] - meters[pos]), apart)
+            distance = np.where(np.isnan(apart), UNKNOWN_SCORE, np.exp(-apart / DISTANCE_SCALE))
+
+            score = TEXT_WEIGHT * text + PRICE_WEIGHT * price + DISTANCE_WEIGHT * distance
+            if len(candidates) > NEIGHBOURS:
+                best = np.argpartition(-score, NEIGHBOURS - 1)[:NEIGHBOURS]
+                candidates, score = candidates[best], score[best]
+            order = np.lexsort((candidates, -score))
+            self.neighbours[pos, :len(order)] = candidates[order]
+            self.scores[pos, :len(order)] = score[order]
+
+    @staticmethod
+    def _counts(restaurant):
+        counts = {}
+        for field, text in restaurant_terms(restaurant):
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                counts[token] = counts.get(token, 0.0) + weight
+        return counts
+
+    def similar(self, pos, k=NEIGHBOURS):
+        """(vị trí, điểm) của tối đa k quán giống quán ở vị trí ``pos`` nhất."""
+        neighbours = self.neighbours[pos, :k]
+        found = neighbours >= 0
+        return neighbours[found], self.scores[pos, :k][found]
+
+
+class SimilarBuilder:
+    """Bảng quán tương tự của danh mục mới nhất, dựng bởi một thread nền duy nhất của process."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.index = None
+        self.version = None
+        # Danh mục mới nhất đang chờ dựng; phiên bản cũ hơn chưa kịp dựng thì bỏ qua
+        self.pending = None
+        # Phiên bản mới nhất đã nhận dựng: session còn giữ bản cũ không làm dựng lại bản cũ
+        self.requested = -1
+        self.thread = None
+
+    def get(self, catalogue):
+        """Bảng của ``catalogue`` nếu đã dựng xong; chưa có thì trả về None và dựng ở nền."""
+        with self.lock:
+            if self.version == catalogue.version:
+                return self.index
+            if catalogue.version <= self.requested:
+                return None
+            self.pending = catalogue
+            self.requested = catalogue.version
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="similar-index", daemon=True)
+                self.thread.start()
+            return None
+
+    def _run(self):
+        try:
+            while True:
+                with self.lock:
+                    catalogue, self.pending = self.pending, None
+                    if catalogue is None:
+                        self.thread = None
+                        return
+                index = SimilarIndex(catalogue)
+                with self.lock:
+                    self.index, self.version = index, catalogue.version
+        except Exception:
+            # Lần gọi get() sau sẽ thử dựng lại
+            with self.lock:
+                self.thread = None
+                self.pending = None
+                self.requested = -1 if self.version is None else self.version
+            raise
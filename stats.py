@@ -0,0 +1,86 @@
+"""Thống kê tổng quan cho trang "📊 Thống kê" của app5, tính một lần cho mỗi phiên bản dữ liệu.
+
+Các cột dạng list (loại món, bữa ăn) được chuyển thành ma trận multi-hot (mỗi
+quán một dòng, mỗi giá trị một cột), nên đếm theo giá trị chỉ là cộng theo cột.
+Kết quả có kích thước cố định (số loại món, số bin giá, lưới 2-D khi quá nhiều
+điểm) bất kể dữ liệu có bao nhiêu quán, để trang thống kê vẽ trong thời gian
+không đổi.
+"""
+
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+
+MEAL_ORDER = ("Sáng", "Trưa", "Tối", "Khuya")
+# Biểu đồ tròn chỉ giữ TOP_TYPES loại món phổ biến nhất, còn lại gộp vào "Khác"
+TOP_TYPES = 20
+OTHER_LABEL = "Khác"
+PRICE_BINS = 10
+# Biểu đồ khoảng cách - giá: tới WEBGL_THRESHOLD quán vẽ từng điểm bằng SVG, tới
+# BINNING_THRESHOLD quán vẽ từng điểm bằng WebGL (scattergl), nhiều hơn nữa thì
+# gộp thành lưới SCATTER_BINS x SCATTER_BINS ô ngay trên server
+WEBGL_THRESHOLD = 1000
+BINNING_THRESHOLD = 10000
+SCATTER_BINS = 40
+
+
+def multi_hot(values):
+    """Series các list -> (ma trận bool n x k, mảng k nhãn theo thứ tự gặp đầu tiên)."""
+    # Trải phẳng bằng itertools nhanh hơn Series.explode (không dựng lại index)
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+    flat = np.fromiter(chain.from_iterable(values), dtype=object, count=lengths.sum())
+    rows = np.repeat(np.arange(len(values)), lengths)
+    codes, labels = pd.factorize(flat)
+    matrix = np.zeros((len(values), len(labels)), dtype=bool)
+    matrix[rows, codes] = True
+    return matrix, np.asarray(labels, dtype=object)
+
+
+class DatasetStats:
+    def __init__(self, df):
+        self.count = len(df)
+        self.mean_price = df["avg_price"].mean()
+        self.mean_rating = df["rating"].mean()
+        self.mean_distance = df["distance"].mean()
+
+        types, labels = multi_hot(df["food_type"])
+        type_counts = pd.Series(types.sum(axis=0), index=labels).sort_values(ascending=False, kind="stable")
+        if len(type_counts) > TOP_TYPES:
+            other = type_counts.iloc[TOP_TYPES - 1:].sum()
+            type_counts = pd.concat([type_counts.iloc[:TOP_TYPES - 1], pd.Series({OTHER_LABEL: other})])
+        self.type_counts = type_counts
+
+        meals, labels = multi_hot(df["meals"])
+        meal_counts = pd.Series(meals.sum(axis=0), index=labels)
+        # Các bữa chuẩn luôn có mặt theo đúng thứ tự, bữa lạ (nếu có) xếp sau
+        order = list(MEAL_ORDER) + [label for label in labels if label not in MEAL_ORDER]
+        self.meal_counts = meal_counts.reindex(order, fill_value=0)
+
+        prices = df["avg_price"].dropna().to_numpy(dtype=float)
+        self.price_counts, self.price_edges = np.histogram(prices, bins=PRICE_BINS)
+
+        points = df[["name", "distance", "avg_price", "rating"]]
+        if len(points) > BINNING_THRESHOLD:
+            self.scatter_mode = "binned"
+            self.scatter = None
+            self.scatter_bins = self._bin(points)
+        else:
+            self.scatter_mode = "webgl" if len(points) > WEBGL_THRESHOLD else "svg"
+            self.scatter = points.reset_index(drop=True)
+            self.scatter_bins = None
+
+    @staticmethod
+    def _bin(points):
+        # (biên x, biên y, số quán mỗi ô, đánh giá TB mỗi ô); kích thước không phụ thuộc số quán
+        points = points.dropna(subset=["distance", "avg_price"])
+        x = points["distance"].to_numpy(dtype=float)
+        y = points["avg_price"].to_numpy(dtype=float)
+        counts, x_edges, y_edges = np.histogram2d(x, y, bins=SCATTER_BINS)
+        rated = points["rating"].notna().to_numpy()
+        rating_counts, _, _ = np.histogram2d(x[rated], y[rated], bins=[x_edges, y_edges])
+        rating_sums, _, _ = np.histogram2d(x[rated], y[rated], bins=[x_edges, y_edges],
+                                           weights=points["rating"].to_numpy(dtype=float)[rated])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ratings = rating_sums / rating_counts
+        return x_edges, y_edges, counts, ratings
@@ -0,0 +1,242 @@
+"""Sinh danh mục quán ăn giả lập (cùng cấu trúc với ``data/restaurants.db``) để đo hiệu năng.
+
+Tên quán, địa chỉ, menu, review, giờ mở cửa và khoảng cách được ghép từ các mẫu
+giống dữ liệu thật, kể cả các chuỗi "bẩn" mà ``parsing`` phải đọc được: giá ghi
+"35.000đ", "25k-30k", "10k/xiên", "179k (nửa con) - 358k (nguyên con)"; khoảng
+cách "200-300m", "<500m", "Cạnh cổng trường FTU"; giờ "10:00 - 14:00, 17:00 - 22:00"...
+Cùng ``seed`` luôn cho cùng một danh mục.
+
+Dùng từ dòng lệnh:
+
+    python synthetic.py <số quán> <file .db hoặc .json> [seed]
+"""
+
+import json
+import math
+import random
+import sys
+
+import data_store
+from geo import CHUA_LANG, METERS_PER_DEGREE
+
+# Loại món (như bộ lọc của app chính) -> (tên món, giá cơ bản nghìn đồng)
+DISHES = {
+    "Cơm/Xôi/Cháo": [("Cơm rang dưa bò", 40), ("Cơm gà xối mỡ", 45), ("Xôi xéo", 20),
+                     ("Xôi gà", 30), ("Cháo sườn", 25), ("Cơm tấm sườn bì", 40)],
+    "Bún/Phở/Miến/Bánh canh/Súp": [("Phở bò tái", 45), ("Phở gà", 40), ("Bún chả", 40),
+                                   ("Bún bò Huế", 45), ("Miến lươn", 40), ("Bánh canh cua", 35),
+                                   ("Bún riêu", 35), ("Súp cua", 20)],
+    "Gà/Thịt chiên": [("Gà rán", 45), ("Cánh gà chiên mắm", 55), ("Đùi gà chiên", 40),
+                      ("Gà chiên xốt cay", 179)],
+    "Đồ Hàn": [("Tokbokki", 89), ("Kimbap", 45), ("Mì lạnh", 95), ("Canh kimchi", 80),
+               ("Lẩu quân đội", 169)],
+    "Nem nướng": [("Nem nướng", 35), ("Nem nướng vip", 55), ("Nem chua rán", 35)],
+    "Bánh mì pate/chảo/muối ớt": [("Bánh mì pate", 20), ("Bánh mì chảo", 35),
+                                  ("Bánh mì muối ớt", 15), ("Bánh mì trứng", 18)],
+    "Bánh tráng": [("Bánh tráng trộn", 25), ("Bánh tráng nướng", 20), ("Bánh tráng cuốn", 30)],
+    "Tacos": [("Tacos gà", 45), ("Tacos bò", 55), ("Burrito", 65)],
+    "Bánh cuốn": [("Bánh cuốn chả quế", 25), ("Bánh cuốn trứng", 30), ("Bánh cuốn nóng", 25)],
+}
+# Món ăn kèm tính theo xiên/quả/lon...
+SIDES = [("Xúc xích", 10, "xiên"), ("Trứng vịt lộn", 10, "quả"), ("Coca", 15, "lon"),
+         ("Chả quế", 10, "miếng"), ("Trà đá", 5, "cốc")]
+
+OWNERS = ["Cô Hằng", "Bà Ba", "Anh Tư", "Chú Béo", "O Chang", "Dung MaMa", "Cô Tuyết",
+          "Hương Giang", "Bảo Lộc", "Nam Béo", "Vân Linh", "Quang Đăng", "Đức Quân", "Minh Anh"]
+NAME_SUFFIXES = ["", "", "", " - Chùa Láng", " (Cơ sở 2)", " 1", " phố cổ"]
+STREETS = ["Chùa Láng", "Phố Chùa Láng", "Láng Hạ", "Nguyễn Chí Thanh", "Pháo Đài Láng",
+           "Huỳnh Thúc Kháng", "Nguyên Hồng", "Láng"]
+WARDS = ["", ", Láng Thượng, Đống Đa", ", Đống Đa", ", Láng Hạ, Đống Đa"]
+
+FAMILY_NAMES = ["Nguyễn", "Trần", "Lê", "Phạm", "Hoàng", "Vũ", "Đặng", "Bùi", "Đỗ", "Mai"]
+GIVEN_NAMES = ["Minh Anh", "Hoàng Long", "Thu Trang", "Quỳnh", "Lan", "Đức", "Phương",
+               "Tùng", "Hà My", "Ngọc", "Khánh Linh", "Thưởng", "Nguyên"]
+# Cụm câu review theo số sao
+REVIEW_PHRASES = {
+    5: ["Rất ngon!", "Đồ ăn tuyệt vời, sẽ quay lại.", "10đ không nói nhiều.",
+        "Cô chú nhiệt tình, quán sạch sẽ thoáng mát."],
+    4: ["Phục vụ tốt.", "Giá hợp lý, hợp túi tiền sinh viên.", "Ngon, nhưng hơi đông giờ trưa.",
+        "Đồ ăn ổn, không gian sạch sẽ."],
+    3: ["Bình thường, ăn được.", "Ổn nhưng cần chú ý vệ sinh.", "Nước dùng hơi nhạt."],
+    2: ["Đợi lâu, đồ ăn nguội.", "Giá hơi cao so với chất lượng."],
+    1: ["Không quay lại.", "Phục vụ kém, đồ ăn không ngon."],
+}
+RATING_WEIGHTS = [6, 1, 16, 37, 51]
+
+# (giờ mở, giờ đóng) thường gặp; quán ăn sáng/trưa đóng sớm, quán đêm qua nửa đêm
+OPENING_HOURS = [("6:00", "22:00"), ("06:30", "21:30"), ("7:00", "14:00"), ("8:00", "22:00"),
+                 ("09:00", "15:00"), ("10:00", "22:00"), ("16:00", "22:00"), ("17:00", "2:00"),
+                 ("5:00", "0:00"), ("10:00", "24:00")]
+
+
+def _menu_price(rng, base):
+    # Giá món ghi theo đủ kiểu như dữ liệu thật
+    price = max(5, int(round(base * rng.uniform(0.8, 1.25))))
+    style = rng.random()
+    if style < 0.55:
+        return f"{price}k"
+    if style < 0.65:
+        return f"{price}.000đ"
+    if style < 0.72:
+        return f"{price * 1000}"
+    if style < 0.82:
+        return f"{price}k-{price + rng.choice([5, 10])}k"
+    if style < 0.88:
+        return f"{price}k (S)"
+    if style < 0.93:
+        return f"{price}k (nửa con) - {price * 2}k (nguyên con)"
+    if style < 0.97:
+        return f"{price}K"
+    return ""
+
+
+def _menu(rng, types):
+    dishes = [dish for food_type in types for dish in DISHES[food_type]]
+    menu = [{"dish": name, "price": _menu_price(rng, base)}
+            for name, base in rng.sample(dishes, min(len(dishes), rng.randint(1, 8)))]
+    if rng.random() < 0.3:
+        name, base, unit = rng.choice(SIDES)
+        menu.append({"dish": name, "price": f"{base}k/{unit}"})
+    return menu
+
+
+def _price_label(menu):
+    # Mức giá nhập tay của quán, theo giá món đầu tiên đọc được
+    for item in menu:
+        digits = "".join(ch if ch.isdigit() else " " for ch in item["price"]).split()
+        if digits:
+            price = int(digits[0])
+            price = price // 1000 if price >= 1000 else price
+            if price < 30:
+                return "<30k"
+            if price < 40:
+                return "30-40k"
+            if price < 50:
+                return "40-50k"
+            return ">50k"
+    return ""
+
+
+def _distance(rng, meters):
+    style = rng.random()
+    if style < 0.02:
+        return "Cạnh cổng trường FTU"
+    if style < 0.04:
+        return ""
+    if style < 0.08:
+        return "<500m" if meters < 500 else f"{meters / 1000:.1f}km"
+    if style < 0.15:
+        low = meters // 100 * 100
+        return f"{low}-{low + 100}m"
+    if meters >= 1000:
+        return f"{meters / 1000:.1f}km"
+    return f"{meters}m"
+
+
+def _hours(rng):
+    style = rng.random()
+    if style < 0.05:
+        return ""
+    if style < 0.08:
+        return "Mở cả ngày"
+    if style < 0.2:
+        return f"10:00 - 14:00, {rng.choice(['17:00', '16:30'])} - 22:00"
+    if style < 0.25:
+        return f"7:00 - 14:00 / 18:00 - {rng.choice(['20:00', '21:30'])}"
+    start, end = rng.choice(OPENING_HOURS)
+    return f"{start} - {end}"
+
+
+def _time_slots(rng, hours):
+    slots = [slot for slot, hour in (("Sáng", 7), ("Trưa", 12), ("Chiều", 15), ("Tối", 19), ("Khuya", 23))
+             if _open_at(hours, hour)]
+    return slots or rng.sample(["Sáng", "Trưa", "Tối"], rng.randint(1, 3))
+
+
+def _open_at(hours, hour):
+    if not hours or "cả ngày" in hours.lower():
+        return bool(hours)
+    for part in hours.replace("/", ",").split(","):
+        start, _, end = part.partition("-")
+        start = int(start.split(":")[0])
+        end = int(end.split(":")[0]) or 24
+        if (start <= hour < end) if start < end else (hour >= start or hour < end):
+            return True
+    return False
+
+
+def _reviews(rng):
+    reviews = []
+    for _ in range(rng.choices([0, 1, 2, 3, 4, 8], [5, 15, 40, 25, 10, 5])[0]):
+        rating = rng.choices(range(1, 6), RATING_WEIGHTS)[0]
+        phrases = rng.sample(REVIEW_PHRASES[rating], min(2, len(REVIEW_PHRASES[rating])))
+        reviews.append({
+            "name": f"{rng.choice(FAMILY_NAMES)} {rng.choice(GIVEN_NAMES)}",
+            "rating": rating,
+            "content": " ".join(phrases),
+        })
+    return reviews
+
+
+def generate_restaurant(rng):
+    types = [rng.choice(list(DISHES))]
+    if rng.random() < 0.1:
+        types.append(rng.choice(list(DISHES)))
+        types = list(dict.fromkeys(types))
+    menu = _menu(rng, types)
+    meters = int(rng.triangular(20, 2500, 400))
+    hours = _hours(rng)
+    lead_dish = menu[0]["dish"] if menu else types[0]
+    record = {
+        "name": f"{lead_dish} {rng.choice(OWNERS)}{rng.choice(NAME_SUFFIXES)}",
+        "address": (f"Số {rng.randint(1, 300)}"
+                    + (f" Ngõ {rng.randint(1, 200)}" if rng.random() < 0.4 else "")
+                    + f" {rng.choice(STREETS)}{rng.choice(WARDS)}"),
+        "distance": _distance(rng, meters),
+        "price": _price_label(menu),
+        "type": types,
+        "time": _time_slots(rng, hours),
+        "hours": hours,
+        "menu": menu,
+        "reviews": _reviews(rng),
+    }
+    if rng.random() < 0.1:
+        record["phone"] = f"09{rng.randint(10000000, 99999999)}"
+    if rng.random() < 0.9:
+        # Tọa độ rải quanh Chùa Láng, cách đúng khoảng ``meters``
+        lat, lng = CHUA_LANG
+        bearing = rng.uniform(0, 2 * math.pi)
+        record["lat"] = round(lat + meters * math.cos(bearing) / METERS_PER_DEGREE, 6)
+        record["lng"] = round(lng + meters * math.sin(bearing) / (METERS_PER_DEGREE * math.cos(math.radians(lat))), 6)
+    return record
+
+
+def generate(count, seed=0):
+    """``count`` quán giả lập, có "id" từ 1 như khi đọc từ kho dữ liệu."""
+    rng = random.Random(seed)
+    restaurants = []
+    for index in range(count):
+        record = generate_restaurant(rng)
+        record["id"] = index + 1
+        restaurants.append(record)
+    return restaurants
+
+
+def main(argv):
+    if len(argv) not in (3, 4) or not argv[1].isdigit() or (len(argv) == 4 and not argv[3].isdigit()):
+        print(__doc__)
+        return 1
+    count, path = int(argv[1]), argv[2]
+    restaurants = generate(count, int(argv[3]) if len(argv) == 4 else 0)
+    if path.endswith(".json"):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(restaurants, f, ensure_ascii=False, indent=2)
+        print(f"Đã ghi {count} quán vào {path}")
+    else:
+        version = data_store.save_restaurants(restaurants, path)
+        print(f"Đã ghi {count} quán vào {path}, phiên bản {version}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
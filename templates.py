@@ -0,0 +1,119 @@
+"""Dựng HTML cho cả một phần trang (danh sách món, review, thẻ tính năng...).
+
+Mỗi hàm trả về một chuỗi HTML duy nhất để gửi bằng một lần ``st.markdown``,
+dùng các class CSS chung thay vì ``style=`` lặp lại ở từng dòng. HTML được
+nối không có dòng trống và không thụt đầu dòng, để Markdown không cắt khối
+HTML hay biến nó thành code block.
+"""
+
+from html import escape
+
+
+def _join(parts):
+    return "".join(parts)
+
+
+def stylesheet(filename):
+    # File CSS nằm trong static/ (server.enableStaticServing trong .streamlit/config.toml).
+    # Mỗi lần rerun chỉ gửi dòng @import này; trình duyệt cache file CSS và font.
+    return f'<style>@import url("app/static/{escape(filename)}");</style>'
+
+
+def section_title(text):
+    return f'<h3 class="detail-heading">{escape(text)}</h3>'
+
+
+def spacer():
+    return '<div class="spacer"></div>'
+
+
+def rating_text(mean, count):
+    # (trung bình, số review) -> "4.5/5 (3 đánh giá)"
+    if not count:
+        return "Chưa có đánh giá"
+    return f"{mean:.1f}/5 ({count} đánh giá)"
+
+
+def restaurant_card(restaurant, rating=None):
+    # rating: (trung bình, số review) của quán, không hiển thị nếu None
+    return _join([
+        '<div class="restaurant-card">',
+        f'<h3 class="restaurant-name">{escape(restaurant["name"])}</h3>',
+        f'<p class="restaurant-address">📍 {escape(restaurant["address"])}</p>',
+        f'<p class="restaurant-rating">⭐ {escape(rating_text(*rating))}</p>' if rating else '',
+        '</div>',
+    ])
+
+
+def detail_header(restaurant):
+    return _join([
+        f'<h2 class="section-title">{escape(restaurant["name"])}</h2>',
+        f'<p class="detail-address">📍 {escape(restaurant["address"])}</p>',
+    ])
+
+
+def info_grid(items, wide_items=()):
+    # items: các cặp (nhãn, giá trị) xếp 3 cột; wide_items chiếm cả dòng
+    cells = [
+        f'<div class="info-item{" wide" if wide else ""}"><p class="info-label">{escape(label)}</p>'
+        f'<p class="info-value">{escape(value)}</p></div>'
+        for (label, value), wide in [(item, False) for item in items] + [(item, True) for item in wide_items]
+    ]
+    return _join(['<div class="info-grid">'] + cells + ['</div>'])
+
+
+def value_list(rows, icon):
+    # rows: các cặp (tên, giá trị) hiển thị mỗi cặp một dòng, giá trị căn phải
+    items = [
+        '<div class="menu-row">'
+        f'<span class="menu-dish">{icon} {escape(name)}</span>'
+        f'<span class="menu-price">{escape(value)}</span>'
+        '</div>'
+        for name, value in rows
+    ]
+    return _join(['<div class="menu-list">'] + items + ['</div>'])
+
+
+def menu_list(menu):
+    return value_list([(item["dish"], item["price"]) for item in menu], "🍽️")
+
+
+def review_stars(rating):
+    # 4.5 -> "⭐⭐⭐⭐½"
+    halves = round(float(rating) * 2)
+    return "⭐" * (halves // 2) + "½" * (halves % 2)
+
+
+def review_list(reviews):
+    items = [
+        '<div class="review">'
+        f'<div class="review-header"><span class="review-stars">{review_stars(review["rating"])}</span>'
+        f'<span class="review-author">- {escape(review["name"])}</span></div>'
+        f'<p class="review-content">"{escape(review["content"])}"</p>'
+        '</div>'
+        for review in reviews
+    ]
+    return _join(['<div class="review-list">'] + items + ['</div>'])
+
+
+def feature_grid(features, columns=2):
+    # features: dict có "icon", "description" và có thể có "title"
+    cards = []
+    for feature in features:
+        title = feature.get("title")
+        cards.append(_join([
+            '<div class="feature-card">',
+            f'<div class="feature-icon">{feature["icon"]}</div>',
+            f'<div class="feature-title">{escape(title)}</div>' if title else '',
+            f'<p class="feature-description">{escape(feature["description"])}</p>',
+            '</div>',
+        ]))
+    return _join([f'<div class="features-grid cols-{columns}">'] + cards + ['</div>'])
+
+
+def text_cards(texts):
+    cards = [
+        f'<div class="restaurant-card"><p class="feature-description">{escape(text)}</p></div>'
+        for text in texts
+    ]
+    return _join(cards)
@@ -0,0 +1,48 @@
+from catalogue import PRICE_BUCKETS, Catalogue
+
+
+def test_price_label_without_menu_matches_overlapping_buckets():
+    # Quán từ đóng góp chưa có menu, chỉ có mức giá chọn trong form
+    labels = ["<30k", "30-50k", ">50k"]
+    catalogue = Catalogue([{"id": i + 1, "name": f"Quán {i}", "address": "", "price": label, "menu": []}
+                           for i, label in enumerate(labels)])
+    found = {bucket: [labels[pos] for pos in catalogue.filter([("price", bucket)])]
+             for bucket in PRICE_BUCKETS}
+    assert found == {
+        "<30k": ["<30k"],
+        "30-40k": ["30-50k"],
+        "40-50k": ["30-50k"],
+        ">50k": [">50k"],
+    }
+
+
+def _catalogue(*restaurants):
+    return Catalogue([dict({"id": i + 1, "address": "", "menu": [], "reviews": []}, **r)
+                      for i, r in enumerate(restaurants)])
+
+
+def test_search_folds_y_and_i():
+    catalogue = _catalogue({"name": "Bánh mì Cô Hằng"}, {"name": "Mỳ cay Bà Ba"})
+    assert catalogue.search("banh my") == [0]
+    assert catalogue.search("mi cay") == [1]
+
+
+def test_few_exact_results_are_followed_by_fuzzy_matches():
+    catalogue = _catalogue(
+        {"name": "Bún chả Hàng Mành"},
+        # Tên món gõ sai: không khớp chính xác "bun"
+        {"name": "Quán Cô Hằng", "menu": [{"dish": "Bunn chả", "price": "35k"}]},
+    )
+    positions, suggestions = catalogue.search_with_suggestions("bun cha")
+    assert positions == [0, 1]
+    assert [match.text for match in suggestions][0] == "Bunn chả"
+
+
+def test_weak_exact_results_come_after_fuzzy_matches():
+    catalogue = _catalogue(
+        # Đủ từ nhưng rải rác trong địa chỉ và review, không có trong tên quán/món
+        {"name": "Quán Cô Hằng", "address": "Ngõ Bún", "reviews": [{"rating": 4, "content": "Chả ngon"}]},
+        {"name": "Quán Bà Ba", "menu": [{"dish": "Bunn chả", "price": "35k"}]},
+    )
+    assert catalogue.search("bun cha") == [0]
+    assert catalogue.search_with_suggestions("bun cha")[0] == [1, 0]
@@ -0,0 +1,26 @@
+import data_store
+from catalogue import LiveCatalogue
+
+
+def test_snapshot_between_bump_and_insert_sees_new_restaurant(tmp_path, monkeypatch):
+    path = str(tmp_path / "restaurants.db")
+    data_store.save_restaurants([{"name": "Phở Cô Hằng", "address": "Số 1 Chùa Láng"}], path)
+    live = LiveCatalogue(path)
+
+    bump = data_store._bump_version
+    snapshots = []
+
+    def bump_then_snapshot(conn):
+        # App chạy lại đúng lúc phiên bản vừa tăng mà quán chưa được ghi
+        version = bump(conn)
+        snapshots.append(live.snapshot())
+        return version
+
+    monkeypatch.setattr(data_store, "_bump_version", bump_then_snapshot)
+    restaurant_id, version = data_store.save_restaurant(
+        {"name": "Bún chả Bà Ba", "address": "Số 2 Chùa Láng"}, path)
+
+    assert snapshots[0].version < version
+    current = live.snapshot()
+    assert current.version == version
+    assert current.get(restaurant_id)["name"] == "Bún chả Bà Ba"
@@ -0,0 +1,56 @@
+import pytest
+
+import contributions
+import data_store
+import moderation
+from catalogue import Catalogue
+
+
+@pytest.fixture
+def stores(tmp_path):
+    restaurants_path = str(tmp_path / "restaurants.db")
+    contributions_path = str(tmp_path / "contributions.db")
+    data_store.save_restaurants([{"name": "Phở Cô Hằng", "address": "Số 1 Chùa Láng"}], restaurants_path)
+    writer = contributions.ContributionWriter(contributions_path)
+    contribution_id = writer.submit("app5", "Bánh mì Cô Ba", "Số 2 Chùa Láng", {
+        "food_type": ["Bánh mì", "Cơm", "Xôi", "Chè"], "rating": 4.5, "review": "Ngon"}).result()
+    writer.close()
+    return restaurants_path, contributions_path, contribution_id
+
+
+def test_form_types_become_catalogue_tags(stores):
+    restaurants_path, contributions_path, contribution_id = stores
+    restaurant = moderation.to_restaurant(contributions.load_contribution(contribution_id, contributions_path))
+    assert restaurant["type"] == ["Bánh mì pate/chảo/muối ớt", "Cơm/Xôi/Cháo", "Chè"]
+
+
+def test_half_star_review_is_not_floored(stores):
+    restaurants_path, contributions_path, contribution_id = stores
+    restaurant_id, version = moderation.approve(contribution_id, restaurants_path, contributions_path)
+    catalogue = Catalogue(data_store.load_restaurants(restaurants_path), version)
+    assert catalogue.ratings.summary(catalogue.positions_by_id[restaurant_id]) == (4.5, 1)
+
+
+@pytest.mark.parametrize("command", ["approve", "merge"])
+def test_retry_after_failed_status_update_does_not_write_twice(stores, monkeypatch, command):
+    restaurants_path, contributions_path, contribution_id = stores
+    set_status = contributions.set_status
+
+    def fail(*args, **kwargs):
+        raise OSError("database is locked")
+
+    if command == "approve":
+        run = lambda: moderation.approve(contribution_id, restaurants_path, contributions_path)
+    else:
+        run = lambda: moderation.merge(contribution_id, 1, restaurants_path, contributions_path)
+    monkeypatch.setattr(contributions, "set_status", fail)
+    with pytest.raises(OSError):
+        run()
+    assert contributions.load_contribution(contribution_id, contributions_path)["status"] == "pending"
+
+    monkeypatch.setattr(contributions, "set_status", set_status)
+    run()
+    restaurants = data_store.load_restaurants(restaurants_path)
+    reviews = [review for r in restaurants for review in r["reviews"]]
+    assert len(reviews) == 1
+    assert contributions.load_contribution(contribution_id, contributions_path)["status"] != "pending"
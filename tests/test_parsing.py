@@ -0,0 +1,57 @@
+import pytest
+
+from parsing import parse_distance, parse_hours, parse_price
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("350m", (350, 350)),
+    ("1.3km", (1300, 1300)),
+    ("200-300m", (200, 300)),
+    ("<500m", (0, 500)),
+    ("Cạnh cổng trường FTU", (0, 100)),
+    ("", None),
+    ("Không rõ", None),
+])
+def test_parse_distance(text, expected):
+    assert parse_distance(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("35k", (35, 35, "")),
+    ("10k/xiên", (10, 10, "xiên")),
+    ("25k-30k", (25, 30, "")),
+    ("18k (S)", (18, 18, "")),
+    ("179k (nửa con) - 358k (nguyên con)", (179, 358, "")),
+    ("35.000đ", (35, 35, "")),
+    ("1.500.000đ", (1500, 1500, "")),
+    ("Combo 2 người 199k", (199, 199, "")),
+    ("30-40k", (30, 40, "")),
+    ("<30k", (0, 30, "")),
+    ("dưới 30k", (0, 30, "")),
+    (">50k", (50, float("inf"), "")),
+    ("trên 50k", (50, float("inf"), "")),
+    ("", None),
+])
+def test_parse_price(text, expected):
+    assert parse_price(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("10:00 - 14:00, 17:00 - 22:00", [(600, 840), (1020, 1320)]),
+    ("5:00 - 0:00", [(300, 1440)]),
+    ("18:00 - 2:00", [(1080, 1440), (0, 120)]),
+    ("Mở đến 22:00", [(360, 1320)]),
+    ("Mở cả ngày", [(0, 1440)]),
+    ("Mở cửa suốt ngày đêm", [(0, 1440)]),
+    ("Mở 24/24", [(0, 1440)]),
+    ("Mở 24h", [(0, 1440)]),
+    # "24h" là giờ đóng cửa, không phải "mở cả ngày"
+    ("17h-24h", [(1020, 1440)]),
+    ("10h - 24h", [(600, 1440)]),
+    ("6h-10h, 16h-24h", [(360, 600), (960, 1440)]),
+    ("Mở đến 24h", [(360, 1440)]),
+    ("", None),
+    ("Nghỉ trưa", None),
+])
+def test_parse_hours(text, expected):
+    assert parse_hours(text) == expected
@@ -0,0 +1,35 @@
+import random
+
+import numpy as np
+
+import recommend
+from catalogue import Catalogue
+
+
+def restaurant(name, hours):
+    return {"name": name, "address": "Chùa Láng", "distance": "300m", "price": "35k",
+            "type": [], "time": ["Trưa"], "hours": hours, "menu": [], "reviews": []}
+
+
+def test_open_mask_uses_the_current_minute_not_the_bucket_start():
+    catalogue = Catalogue([
+        restaurant("Đóng lúc 12:05", "6:00 - 12:05"),
+        restaurant("Mở từ 12:07", "12:07 - 22:00"),
+        restaurant("Chưa rõ giờ", ""),
+    ], 1)
+    # Dựng ở phút đầu khung 12:00, dùng lại đến 12:09
+    recommender = recommend.Recommender(catalogue, 12 * 60)
+    assert sorted(recommender.top(3, 12 * 60 + 1)) == [0, 2]
+    assert sorted(recommender.top(3, 12 * 60 + 8)) == [1, 2]
+    picks = {recommender.surprise(12 * 60 + 8, random.Random(seed)) for seed in range(50)}
+    assert picks == {1, 2}
+
+
+def test_surprise_falls_back_when_few_restaurants_are_open():
+    catalogue = Catalogue([restaurant(f"Quán {i}", "6:00 - 12:00") for i in range(200)]
+                          + [restaurant("Quán đêm", "22:00 - 2:00")], 1)
+    recommender = recommend.Recommender(catalogue, 23 * 60)
+    rng = random.Random(0)
+    assert {recommender.surprise(23 * 60, rng) for _ in range(20)} == {200}
+    assert recommender.surprise(15 * 60, rng) is None
+    assert np.array_equal(recommender.top(3, 15 * 60), [])
@@ -0,0 +1,238 @@
+"""Tìm kiếm toàn văn không dấu trên tên quán, địa chỉ, tên món và review.
+
+Chỉ mục được dựng một lần cho mỗi phiên bản dữ liệu:
+
+- chỉ mục ngược: từ (đã bỏ dấu) -> (mảng vị trí quán, mảng điểm)
+- chỉ mục trigram trên từ vựng, để từ đang gõ dở ("pho b", "tokb") vẫn khớp
+  mà không phải duyệt toàn bộ từ vựng
+"""
+
+import copy
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+
+import numpy as np
+
+# Trọng số theo trường: khớp tên quán quan trọng hơn khớp trong review
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "dish": 2.0,
+    "type": 1.5,
+    "address": 1.0,
+    "review": 0.5,
+}
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def fold(text):
+    """Chữ thường, bỏ dấu tiếng Việt: "Phở bò Đức" -> "pho bo duc"."""
+    text = (text or "").lower().replace("đ", "d")
+    decomposed = unicodedata.normalize("NFD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def normalize(token):
+    # "mỳ"/"mì", "kỳ"/"kì" là hai cách viết của cùng một từ: "y" cuối từ sau phụ âm -> "i"
+    if len(token) >= 2 and token.endswith("y") and token[-2] not in "aeiouy":
+        return token[:-1] + "i"
+    return token
+
+
+def tokenize(text):
+    return [normalize(token) for token in _WORD_RE.findall(fold(text))]
+
+
+def trigrams(token):
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def restaurant_fields(restaurant):
+    # (trường, đoạn văn bản) được đưa vào chỉ mục cho một quán
+    yield "name", restaurant.get("name", "")
+    yield "address", restaurant.get("address", "")
+    for value in restaurant.get("type", []):
+        yield "type", value
+    for item in restaurant.get("menu", []):
+        yield "dish", item.get("dish", "")
+    for review in restaurant.get("reviews", []):
+        yield "review", review.get("content", "")
+
+
+class TextIndex:
+    # Số quán đứng đầu được chấm lại theo cụm từ (khớp liền, khớp đúng dấu)
+    RERANK_POOL = 50
+    # Từ chỉ khớp tiền tố ("pho" -> "phong") được ít điểm hơn từ khớp đúng
+    PREFIX_PENALTY = 0.5
+
+    def __init__(self, restaurants):
+        self.restaurants = restaurants
+        self.size = len(restaurants)
+        # Từ -> tổng trọng số trường của từng quán, để cập nhật khi một quán thay đổi
+        self.documents = [self._document(r) for r in restaurants]
+
+        postings = {}
+        for pos, document in enumerate(self.documents):
+            for token, weight in document.items():
+                postings.setdefault(token, {})[pos] = weight
+
+        # Mỗi từ -> (mảng vị trí quán, mảng trọng số đã bão hòa kiểu BM25); idf
+        # phụ thuộc số quán trong danh mục nên được nhân vào lúc tìm
+        self.postings = {}
+        for token, entry in postings.items():
+            positions = np.fromiter(entry.keys(), dtype=np.int64, count=len(entry))
+            weights = np.fromiter(entry.values(), dtype=float, count=len(entry))
+            self.postings[token] = (positions, weights / (weights + 1.2))
+
+        self.vocabulary = sorted(self.postings)
+        self.trigram_index = {}
+        for token in self.vocabulary:
+            for gram in trigrams(token):
+                self.trigram_index.setdefault(gram, set()).add(token)
+
+    @staticmethod
+    def _document(restaurant):
+        document = {}
+        for field, text in restaurant_fields(restaurant):
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                document[token] = document.get(token, 0.0) + weight
+        return document
+
+    def updated(self, restaurants, changed):
+        """Bản mới sau khi các quán ở vị trí ``changed`` được thêm/sửa.
+
+        Chỉ danh sách vị trí của các từ xuất hiện trong những quán này được tính lại.
+        """
+        new = copy.copy(self)
+        new.restaurants = restaurants
+        new.size = len(restaurants)
+        new.documents = self.documents + [{} for _ in range(new.size - self.size)]
+        tokens = set()
+        for pos in changed:
+            tokens |= new.documents[pos].keys()
+            new.documents[pos] = self._document(restaurants[pos])
+            tokens |= new.documents[pos].keys()
+
+        changed = np.array(sorted(changed), dtype=np.int64)
+        new.postings = dict(self.postings)
+        added, removed = [], []
+        for token in tokens:
+            positions, weights = self.postings.get(token, (changed[:0], np.empty(0)))
+            keep = ~np.isin(positions, changed)
+            fresh = [pos for pos in changed.tolist() if token in new.documents[pos]]
+            fresh_weights = np.array([new.documents[pos][token] for pos in fresh], dtype=float)
+            positions = np.concatenate([positions[keep], np.array(fresh, dtype=np.int64)])
+            weights = np.concatenate([weights[keep], fresh_weights / (fresh_weights + 1.2)])
+            if len(positions) == 0:
+                del new.postings[token]
+                removed.append(token)
+                continue
+            order = np.argsort(positions, kind="stable")
+            new.postings[token] = (positions[order], weights[order])
+            if token not in self.postings:
+                added.append(token)
+
+        if added or removed:
+            new.vocabulary = sorted(new.postings)
+            new.trigram_index = dict(self.trigram_index)
+            for token in added:
+                for gram in trigrams(token):
+                    new.trigram_index[gram] = new.trigram_index.get(gram, set()) | {token}
+            for token in removed:
+                for gram in trigrams(token):
+                    new.trigram_index[gram] = new.trigram_index[gram] - {token}
+        return new
+
+    def idf(self, positions):
+        return math.log(1 + self.size / len(positions))
+
+    def expand(self, token, prefix=False):
+        """Các từ trong từ vựng khớp với `token` của truy vấn.
+
+        Từ cuối cùng (đang gõ) được khớp theo tiền tố, các từ khác phải khớp đúng.
+        """
+        if not prefix:
+            return [token] if token in self.postings else []
+        if len(token) < 3:
+            start = bisect_left(self.vocabulary, token)
+            matches = []
+            for word in self.vocabulary[start:]:
+                if not word.startswith(token):
+                    break
+                matches.append(word)
+            return matches
+
+        # Tiền tố dài: giao các tập trigram (ít phần tử trước) rồi kiểm tra lại
+        grams = [g for g in trigrams(token) if not g.endswith(" ")]
+        candidates = None
+        for gram in sorted(grams, key=lambda g: len(self.trigram_index.get(g, ()))):
+            found = self.trigram_index.get(gram)
+            if not found:
+                return []
+            candidates = set(found) if candidates is None else candidates & found
+            if not candidates:
+                return []
+        return [word for word in candidates if word.startswith(token)]
+
+    def _phrase_bonus(self, pos, phrase, raw_phrase):
+        restaurant = self.restaurants[pos]
+        name = restaurant.get("name", "")
+        dishes = [item.get("dish", "") for item in restaurant.get("menu", [])]
+        # So khớp nguyên từ: "pho" không được tính là cụm trong "hai phong"
+        phrase = f" {phrase} "
+        bonus = 0.0
+        if phrase in f" {' '.join(tokenize(name))} ":
+            bonus += 2.0
+        elif any(phrase in f" {' '.join(tokenize(dish))} " for dish in dishes):
+            bonus += 1.0
+        # Người dùng gõ có dấu ("phở") thì ưu tiên chỗ khớp đúng dấu hơn "phô"
+        if raw_phrase.strip() != phrase.strip():
+            raw_phrase = f" {raw_phrase} "
+            for text in [name] + dishes:
+                if raw_phrase in f" {' '.join(_WORD_RE.findall(text.lower()))} ":
+                    bonus += 1.0
+                    break
+        return bonus
+
+    def search(self, query, limit=None):
+        """Danh sách (vị trí quán, điểm) khớp mọi từ trong truy vấn, điểm cao trước."""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        scores = None
+        for i, token in enumerate(tokens):
+            token_scores = np.zeros(self.size)
+            for word in self.expand(token, prefix=i == len(tokens) - 1):
+                positions, word_scores = self.postings[word]
+                scale = self.idf(positions)
+                if word != token:
+                    scale *= self.PREFIX_PENALTY
+                word_scores = word_scores * scale
+                token_scores[positions] = np.maximum(token_scores[positions], word_scores)
+            if scores is None:
+                scores = token_scores
+            else:
+                # Mọi từ trong truy vấn đều phải khớp
+                scores = np.where((scores > 0) & (token_scores > 0), scores + token_scores, 0.0)
+        matched = np.flatnonzero(scores)
+        if len(matched) == 0:
+            return []
+
+        # Chỉ chấm lại cụm từ cho nhóm điểm cao nhất
+        pool = min(len(matched), max(self.RERANK_POOL, limit or 0))
+        top = matched[np.argpartition(-scores[matched], pool - 1)[:pool]]
+        phrase = " ".join(tokens)
+        raw_phrase = " ".join(_WORD_RE.findall(query.lower()))
+        for pos in top:
+            scores[pos] += self._phrase_bonus(pos, phrase, raw_phrase)
+
+        if limit:
+            top = top[np.lexsort((top, -scores[top]))][:limit]
+            return [(int(pos), float(scores[pos])) for pos in top]
+        ranked = matched[np.lexsort((matched, -scores[matched]))]
+        return [(int(pos), float(scores[pos])) for pos in ranked]